@@ -0,0 +1,42 @@
+#!/usr/bin/env python3
+"""
+add_driver_array() build time against channel count.
+
+Each array is also rendered, since a generator run pays for that too, and
+run through the ERC, which must come back clean apart from the gate labels
+that lead nowhere in a standalone array.
+
+Run: python bench_driver_array.py [channels ...]
+"""
+
+import os
+import sys
+import time
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(HERE, ".."))
+
+import schgen
+from schgen.erc import check
+
+
+def main():
+    counts = [int(a) for a in sys.argv[1:]] or [8, 64, 512]
+    print(f"{'channels':>9} {'items':>7} {'build ms':>9} {'us/channel':>11} "
+          f"{'render ms':>10} {'erc':>4}")
+    for channels in counts:
+        t0 = time.perf_counter()
+        sb = schgen.SchematicBuilder()
+        schgen.add_driver_array(sb, 25.40, 25.40, channels)
+        build = time.perf_counter() - t0
+        t0 = time.perf_counter()
+        schgen.generate(sb)
+        render = time.perf_counter() - t0
+        violations = [v for v in check(sb) if v.rule != "single-label"]
+        assert not violations, violations[0]
+        print(f"{channels:>9} {len(sb.items):>7} {build * 1e3:>9.2f} "
+              f"{build / channels * 1e6:>11.1f} {render * 1e3:>10.2f} {'ok':>4}")
+
+
+if __name__ == "__main__":
+    main()
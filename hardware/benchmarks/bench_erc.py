@@ -0,0 +1,42 @@
+#!/usr/bin/env python3
+"""
+ERC time against design size, on the resistor ladders of bench_netlist.py.
+
+Each column leaves its first pin unconnected and its bus and last rung
+dangling, and every rung taps the bus without a junction, so the rules have
+violations to report as well as connections to clear.
+
+Run: python bench_erc.py [max_segments]
+"""
+
+import os
+import sys
+import time
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(HERE, ".."))
+
+from schgen.items import Wire
+from schgen.erc import check
+from bench_netlist import ladder
+
+
+def main():
+    max_segments = int(sys.argv[1]) if len(sys.argv) > 1 else 150_000
+    print(f"{'segments':>9} {'items':>8} {'violations':>11} {'erc s':>8} {'us/item':>8}")
+    n = 1000
+    while True:
+        sb = ladder(n)
+        segments = sum(1 for item in sb.items if isinstance(item, Wire))
+        if segments > max_segments:
+            break
+        t0 = time.perf_counter()
+        violations = check(sb)
+        dt = time.perf_counter() - t0
+        print(f"{segments:>9} {len(sb.items):>8} {len(violations):>11} {dt:>8.3f} "
+              f"{dt / len(sb.items) * 1e6:>8.2f}")
+        n *= 4
+
+
+if __name__ == "__main__":
+    main()
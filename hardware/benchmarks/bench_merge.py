@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+--merge time against design size: read an edited schematic and carry its
+layout over to a fresh build, by driver channel count.
+
+The "edited" file is the build itself plus items drawn in KiCad (random
+UUIDs): a wire, a power symbol with a #PWR reference the build also uses, a
+local label and a text.  It also holds a wire numbered by the generator
+before name-based UUIDs, and the fresh build that it is merged into no
+longer generates one of the file's wires, as after that wire is removed
+from the board sources.  Each merge is checked to keep the drawn items,
+renumbering the power symbol, and to drop both stale generated wires.
+
+Run: python bench_merge.py [repeats] [drivers ...]
+"""
+
+import os
+import sys
+import tempfile
+import time
+import uuid
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(HERE, ".."))
+
+from schgen.items import Label, Power, RawItem, Wire
+from schgen.merge import merge_layout
+from schgen.schfile import read_schematic
+from schgen.units import to_nm
+from schgen.writer import write_schematic
+from OPNhydro_r2 import generate_schematic as board
+
+
+def edited_file(path, drivers):
+    """Write the build for `drivers`, items drawn in KiCad and a wire of the
+    old generator to `path`; return (drawn items, old wire)."""
+    sb = board.build_schematic(drivers=drivers)
+    x, y = to_nm(20.32), to_nm(20.32)
+    wire = Wire(x, y, x + to_nm(5.08), y, str(uuid.uuid4()))
+    power = Power("power:GND", "#PWR001", "GND", x, y, 0, "", "", {},
+                  (("1", str(uuid.uuid4())),), str(uuid.uuid4()))
+    label = Label("SENSE", x, y, 0, None, str(uuid.uuid4()))
+    uid = str(uuid.uuid4())
+    text = RawItem(f'(text "drawn" (at 20.32 15.24 0) (effects (font (size 1.27 1.27))) '
+                   f'(uuid "{uid}"))', uid)
+    old = Wire(x, y, x, y + to_nm(5.08), "a0000000-0000-4000-8000-000000000042")
+    drawn = [wire, power, label, text]
+    sb.items += drawn + [old]
+    with open(path, "w", encoding="utf-8") as f:
+        write_schematic(f, sb)
+    return drawn, old
+
+
+def fresh_build(drivers):
+    """The build for `drivers` less its first wire; return (builder, the
+    dropped wire's UUID)."""
+    sb = board.build_schematic(drivers=drivers)
+    stale = next(item for item in sb.items if isinstance(item, Wire))
+    sb.items.remove(stale)
+    return sb, stale.uuid
+
+
+def main():
+    repeats = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    counts = [int(a) for a in sys.argv[2:]] or [6, 32, 64]
+    print(f"{'drivers':>8} {'items':>7} {'read ms':>9} {'merge ms':>9} {'added':>6} {'check':>6}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for drivers in counts:
+            path = os.path.join(tmp, f"edited-{drivers}.kicad_sch")
+            drawn, old = edited_file(path, drivers)
+            read = merge = float("inf")
+            for _ in range(repeats):
+                t0 = time.perf_counter()
+                sch = read_schematic(path)
+                read = min(read, time.perf_counter() - t0)
+                sb, stale = fresh_build(drivers)
+                t0 = time.perf_counter()
+                moved, added = merge_layout(sb, sch)
+                merge = min(merge, time.perf_counter() - t0)
+
+            uuids = {item.uuid for item in sb.items}
+            assert stale not in uuids, "a wire the build no longer generates came back"
+            assert old.uuid not in uuids, "a wire of the old generator came back"
+            for item in drawn:
+                assert item.uuid in uuids, f"{type(item).__name__} drawn in KiCad was dropped"
+            assert (moved, added) == (0, len(drawn)), (moved, added)
+            refs = [item.ref for item in sb.items if isinstance(item, Power)]
+            assert len(refs) == len(set(refs)), "power symbol references collide"
+            print(f"{drivers:>8} {len(sb.items):>7} {read * 1e3:>9.2f} "
+                  f"{merge * 1e3:>9.2f} {added:>6} {'ok':>6}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+Netlist extraction time against design size.
+
+The synthetic design is a grid of resistor ladders: each resistor's lower
+pin is wired to the next one's upper pin through two segments, every rung
+gets a global label and a wire tapping a shared bus, so the connectivity
+pass sees wire ends, T-joins on wire interiors, labels and pins.
+
+Run: python bench_netlist.py [max_segments]
+"""
+
+import os
+import sys
+import time
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(HERE, ".."))
+
+from schgen import SchematicBuilder
+from schgen.netlist import extract_netlist
+
+
+def ladder(n_resistors, per_column=100):
+    sb = SchematicBuilder()
+    columns = -(-n_resistors // per_column)
+    for c in range(columns):
+        x = 25.40 + c * 12.70
+        bus_x = x + 5.08
+        top = 25.40
+        bottom = top + per_column * 10.16
+        sb.add_wire(bus_x, top, bus_x, bottom)
+        for r in range(min(per_column, n_resistors - c * per_column)):
+            y = top + 3.81 + r * 10.16
+            sb.add_symbol("Device:R", f"R{c * per_column + r + 1}", "10k", x, y)
+            # lower pin -> next upper pin, via a jog
+            sb.add_wire(x, y + 3.81, x, y + 5.08)
+            sb.add_wire(x, y + 5.08, x, y + 6.35)
+            # tap into the bus (ends on the bus interior)
+            sb.add_wire(x, y + 5.08, bus_x, y + 5.08)
+            sb.add_junction(x, y + 5.08)
+            sb.add_global_label(f"TAP{r}", x, y + 5.08)
+    return sb
+
+
+def main():
+    max_segments = int(sys.argv[1]) if len(sys.argv) > 1 else 150_000
+    print(f"{'segments':>9} {'pins':>8} {'nets':>7} {'extract s':>10} {'us/segment':>11}")
+    n = 1000
+    while True:
+        sb = ladder(n)
+        segments = sum(1 for item in sb.items if type(item).__name__ == "Wire")
+        if segments > max_segments:
+            break
+        t0 = time.perf_counter()
+        nets = extract_netlist(sb)
+        dt = time.perf_counter() - t0
+        print(f"{segments:>9} {2 * n:>8} {len(nets):>7} {dt:>10.3f} {dt / segments * 1e6:>11.2f}")
+        n *= 4
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""
+Serial vs. process-pool section build, by driver channel count and number
+of worker processes.
+
+Large variants are dominated by section_drivers(), which is built in
+chunks of DRIVER_CHUNK channels so that it spreads over the pool.  Each
+parallel build is checked to render byte-identical to the serial one.
+Pool start-up is included in the timings, since that is what a generator
+run pays.
+
+Run: python bench_parallel_sections.py [repeats] [drivers ...]
+"""
+
+import os
+import sys
+import time
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(HERE, ".."))
+
+import schgen
+from OPNhydro_r2 import generate_schematic as board
+
+
+def best_of(fn, repeats):
+    best = float("inf")
+    for _ in range(repeats):
+        t0 = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - t0)
+    return best, result
+
+
+def main():
+    repeats = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    counts = [int(a) for a in sys.argv[2:]] or [6, 32, 64]
+    cpus = os.cpu_count() or 1
+    print(f"{len(board.SECTIONS)} sections, {cpus} CPU(s)")
+    print(f"{'drivers':>8} {'chunks':>7} {'items':>6} {'jobs':>5} {'build ms':>10} {'speedup':>8}")
+    for drivers in counts:
+        serial_dt, serial_sb = best_of(lambda: board.build_schematic(drivers=drivers), repeats)
+        reference = schgen.generate(serial_sb)
+        chunks = board.driver_chunks(drivers=drivers)
+        print(f"{drivers:>8} {chunks:>7} {len(serial_sb.items):>6} {1:>5} "
+              f"{serial_dt * 1e3:>10.2f} {1.0:>8.2f}")
+        jobs = 2
+        while jobs <= max(2, cpus):
+            dt, sb = best_of(lambda: board.build_schematic(drivers=drivers, jobs=jobs), repeats)
+            assert schgen.generate(sb) == reference, \
+                f"drivers={drivers} jobs={jobs} differs from serial build"
+            print(f"{'':>8} {'':>7} {'':>6} {jobs:>5} {dt * 1e3:>10.2f} {serial_dt / dt:>8.2f}")
+            jobs *= 2
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,43 @@
+#!/usr/bin/env python3
+"""
+Throughput of the S-expression parser on the committed KiCad schematics.
+
+Every file is also checked to round-trip byte for byte.
+
+Run: python bench_sexpr_parse.py [repeats]
+"""
+
+import glob
+import os
+import sys
+import time
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+HARDWARE = os.path.join(HERE, "..")
+sys.path.insert(0, HARDWARE)
+
+from schgen import parser
+
+
+def main():
+    repeats = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    paths = sorted(glob.glob(os.path.join(HARDWARE, "OPNhydro_r*", "*.kicad_sch"))
+                   + glob.glob(os.path.join(HARDWARE, "OPNhydro_r*", "*.kicad_sch-bak")))
+    print(f"{'file':<38} {'MB':>6} {'lines':>7} {'best ms':>8} {'MB/s':>6}  round-trip")
+    for path in paths:
+        with open(path, "rb") as f:
+            data = f.read()
+        best = float("inf")
+        for _ in range(repeats):
+            t0 = time.perf_counter()
+            doc = parser.load(path)
+            best = min(best, time.perf_counter() - t0)
+        ok = parser.dumps(doc).encode("utf-8") == data
+        lines = data.count(b"\n")
+        print(f"{os.path.relpath(path, HARDWARE):<38} {len(data) / 1e6:>6.2f} "
+              f"{lines:>7} {best * 1e3:>8.1f} {len(data) / 1e6 / best:>6.1f}  "
+              f"{'exact' if ok else 'MISMATCH'}")
+
+
+if __name__ == "__main__":
+    main()
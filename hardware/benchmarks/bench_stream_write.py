@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Peak RSS of joined vs. streamed schematic output, against schematic size.
+
+The schematic is scaled by replicating the items of build_schematic() N
+times.  Every measurement runs in a fresh interpreter so ru_maxrss is not
+polluted by earlier runs.
+
+Run: python bench_stream_write.py [max_copies]
+"""
+
+import os
+import resource
+import subprocess
+import sys
+import time
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(HERE, ".."))
+
+
+def child(mode, copies):
+    import schgen
+    from OPNhydro_r2 import generate_schematic as board
+
+    sb = board.build_schematic()
+    base = list(sb.items)
+    for _ in range(copies - 1):
+        sb.items.extend(base)
+
+    t0 = time.perf_counter()
+    with open(os.devnull, "w", encoding="utf-8") as f:
+        if mode == "join":
+            content = schgen.generate(sb)
+            f.write(content)
+            size = len(content)
+        else:
+            size = schgen.write_schematic(f, sb)
+    dt = time.perf_counter() - t0
+    rss_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    print(f"{size} {rss_kb} {dt:.4f}")
+
+
+def run(mode, copies):
+    out = subprocess.run([sys.executable, __file__, "--child", mode, str(copies)],
+                         check=True, capture_output=True, text=True).stdout
+    size, rss_kb, dt = out.split()
+    return int(size), int(rss_kb), float(dt)
+
+
+def main():
+    max_copies = int(sys.argv[1]) if len(sys.argv) > 1 else 256
+    print(f"{'copies':>7} {'size MB':>9} {'join RSS MB':>12} {'stream RSS MB':>14} "
+          f"{'join s':>8} {'stream s':>9}")
+    copies = 1
+    while copies <= max_copies:
+        size, join_rss, join_dt = run("join", copies)
+        _, stream_rss, stream_dt = run("stream", copies)
+        print(f"{copies:>7} {size / 1e6:>9.1f} {join_rss / 1024:>12.1f} "
+              f"{stream_rss / 1024:>14.1f} {join_dt:>8.3f} {stream_dt:>9.3f}")
+        copies *= 4
+
+
+if __name__ == "__main__":
+    if len(sys.argv) == 4 and sys.argv[1] == "--child":
+        child(sys.argv[2], int(sys.argv[3]))
+    else:
+        main()
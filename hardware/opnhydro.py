@@ -0,0 +1,468 @@
+"""
+Section functions of the OPNhydroponics controller carrier PCB, shared by
+the board revisions until they diverge.
+
+Each OPNhydro_rN/generate_schematic.py gives its directory (design.json and
+the library copies) and parameters to build_schematic() below; the
+sections place the parts:
+- Power input, protection, and regulation
+- ESP32-C6-DevKitC-1 pin headers
+- I2C sensor connectors (EZO pH/EC/DO, BME280, BH1750, OLED)
+- 1-Wire, ultrasonic, and float switch interfaces
+- 6× MOSFET driver circuits (pumps + ATO valve)
+- WS2812B status LED
+- Test points
+"""
+
+import os
+
+from schgen import build_sections, add_driver_array, add_symbol_library
+from schgen.design import load_design
+
+# Tables read from the design file; each section takes the ones it uses.
+# Positions are mm from the section's origin.
+DESIGN_SCHEMA = {
+    "left_pins": (("net", str), ("shape", str)),        # DevKit J16, pin 1 first
+    "right_pins": (("net", str), ("shape", str)),       # DevKit J17, pin 1 first
+    "i2c_connectors": (("ref", str), ("value", str), ("dx", float), ("dy", float)),
+    "bnc_conns": (("ref", str), ("value", str), ("dx", float), ("dy", float)),
+    "float_switches": (("r_ref", str), ("r_value", str), ("c_ref", str), ("c_value", str),
+                       ("j_ref", str), ("j_value", str), ("label", str),
+                       ("dx", float), ("dy", float)),
+    "driver_channels": (("label", str), ("load", str)),  # named driver channels
+    "test_point_nets": (("ref", str), ("value", str), ("net", str)),
+}
+
+DRIVER_PITCH = 30.48
+DRIVER_CHUNK = 8  # driver channels per chunk of section_drivers()
+
+
+def _stub(sb, ref, num, length=2.54):
+    """Draw a wire `length` mm to the left of pin `num` of connector `ref`;
+    return its free end, for the label or power symbol."""
+    px, py = sb.pin(ref, num)
+    sb.add_wire(px, py, px - length, py)
+    return px - length, py
+
+
+# ===================================================================
+# SECTION 1: POWER INPUT & PROTECTION
+# ===================================================================
+def section_power_input(sb, **_):
+    sx, sy = 25.40, 30.48   # Section origin
+
+    sb.add_text("POWER INPUT & PROTECTION", sx, sy - 5.08, size=3.0)
+    sb.add_text_box("", sx - 2.54, sy - 7.62, 170.18, 55.88)
+
+    # J1 - 12V Power Input (2-pin screw terminal)
+    jx, jy = sx, sy + 10.16
+    sb.add_symbol("Connector:Conn_01x02_Pin", "J1", "12V_IN",
+                  jx, jy, footprint="Connector_Phoenix_MSTB:PhoenixContact_MSTBA_2,5_2-G-5,08_1x02_P5.08mm_Horizontal")
+    # Pin 1 = +12V, Pin 2 = GND
+    sb.add_global_label("+12V_RAW", *sb.pin("J1", "1"), rot=180)
+    sb.add_power("GND", *_stub(sb, "J1", "2"), rot=90)
+
+    # F1 - PTC Fuse (5A)
+    fx, fy = sx + 20.32, sy + 11.43
+    sb.add_symbol("Device:Fuse", "F1", "RXEF500 5A", fx, fy, rot=90,
+                  footprint="Fuse:Fuse_1812_4532Metric")
+    sb.add_global_label("+12V_RAW", *sb.pin("F1", "1"), rot=180)
+    sb.add_global_label("12V_FUSED", *sb.pin("F1", "2"), rot=0)
+
+    # D1 - TVS Diode (SMBJ15A)
+    dx, dy = sx + 40.64, sy + 11.43
+    sb.add_symbol("Device:D_TVS", "D1", "SMBJ15A", dx, dy + 7.62, rot=0,
+                  footprint="Diode_SMD:D_SMB_Handsoldering")
+    sb.add_global_label("12V_FUSED", *sb.pin("D1", "1"), rot=180)
+    ax, ay = sb.pin("D1", "2")
+    sb.add_power("GND", ax, ay + 2.54)
+    sb.add_wire(ax, ay, ax, ay + 2.54)
+
+    # Q1 - P-MOSFET reverse polarity protection (SI2301)
+    qx, qy = sx + 60.96, sy + 11.43
+    sb.add_symbol("Device:Q_PMOS_GSD", "Q1", "SI2301", qx, qy,
+                  footprint="Package_TO_SOT_SMD:SOT-23")
+    # R1 - 10k gate to source
+    sb.add_symbol("Device:R", "R1", "10k", qx - 10.16, qy + 5.08,
+                  footprint="Resistor_SMD:R_0805_2012Metric")
+    # R2 - 100k gate to GND
+    sb.add_symbol("Device:R", "R2", "100k", qx - 10.16, qy - 7.62,
+                  footprint="Resistor_SMD:R_0805_2012Metric")
+    sb.add_global_label("12V_FUSED", qx - 15.24, qy, rot=180)
+    sb.add_global_label("+12V", qx + 2.54, qy + 5.08, rot=0)
+    sb.add_power("GND", qx - 10.16, qy - 11.43 - 3.81)
+
+
+# ===================================================================
+# SECTION 2: VOLTAGE REGULATORS
+# ===================================================================
+def section_regulators(sb, **_):
+    sx, sy = 25.40, 30.48   # Power input section origin
+    rx, ry = sx + 105.0, sy  # Regulator section origin
+
+    sb.add_text("VOLTAGE REGULATORS", rx, ry - 5.08, size=3.0)
+
+    # Buck converter module (MP1584EN) - represented as 3-pin module
+    bx, by = rx, ry + 10.16
+    sb.add_symbol("Connector:Conn_01x03_Pin", "U1", "MP1584EN Module",
+                  bx, by, footprint="")
+    sb.add_text("12V->5V Buck", bx + 5.08, by - 5.08, size=1.27)
+    sb.add_global_label("+12V", bx - 3.81, by + 2.54, rot=180)
+    sb.add_power("GND", bx - 3.81 - 2.54, by)
+    sb.add_wire(bx - 3.81, by, bx - 3.81 - 2.54, by)
+    sb.add_global_label("+5V", bx - 3.81, by - 2.54, rot=180)
+
+    # C_BUCK_OUT - 22µF output cap for buck
+    sb.add_symbol("Device:C", "C1", "22uF", bx + 10.16, by + 5.08,
+                  footprint="Capacitor_SMD:C_0805_2012Metric")
+    sb.add_global_label("+5V", *sb.pin("C1", "1"), rot=0)
+    sb.add_power("GND", *sb.pin("C1", "2"))
+
+    # U2 - AMS1117-3.3 LDO
+    ux, uy = rx + 30.48, ry + 10.16
+    sb.add_symbol("Regulator_Linear:AMS1117-3.3", "U2", "AMS1117-3.3",
+                  ux, uy, footprint="Package_TO_SOT_SMD:SOT-223-3_TabPin2")
+    sb.add_global_label("+5V", *sb.pin("U2", "3"), rot=180)
+    sb.add_global_label("+3V3", *sb.pin("U2", "2"), rot=0)
+    sb.add_power("GND", *sb.pin("U2", "1"))
+
+    # C_LDO_IN - 10µF input
+    sb.add_symbol("Device:C", "C2", "10uF", ux - 12.70, uy + 5.08,
+                  footprint="Capacitor_SMD:C_0805_2012Metric")
+    sb.add_global_label("+5V", *sb.pin("C2", "1"), rot=0)
+    sb.add_power("GND", *sb.pin("C2", "2"))
+
+    # C_LDO_OUT - 10µF output
+    sb.add_symbol("Device:C", "C3", "10uF", ux + 12.70, uy + 5.08,
+                  footprint="Capacitor_SMD:C_0805_2012Metric")
+    sb.add_global_label("+3V3", *sb.pin("C3", "1"), rot=0)
+    sb.add_power("GND", *sb.pin("C3", "2"))
+
+    # PWR_FLAG symbols
+    pfx = rx + 55.0
+    sb.add_power("PWR_FLAG", pfx, ry + 5.08, rot=0)
+    sb.add_global_label("+12V", pfx, ry + 5.08, rot=0)
+    sb.add_power("PWR_FLAG", pfx + 12.70, ry + 5.08, rot=0)
+    sb.add_global_label("+5V", pfx + 12.70, ry + 5.08, rot=0)
+    sb.add_power("PWR_FLAG", pfx + 25.40, ry + 5.08, rot=0)
+    sb.add_global_label("+3V3", pfx + 25.40, ry + 5.08, rot=0)
+    sb.add_power("PWR_FLAG", pfx + 38.10, ry + 5.08, rot=0)
+    sb.add_power("GND", pfx + 38.10, ry + 5.08)
+
+
+# ===================================================================
+# SECTION 3: ESP32-C6 DEVKIT HEADERS
+# ===================================================================
+def section_devkit_headers(sb, left_pins, right_pins, **_):
+    ex, ey = 130.0, 88.90
+
+    sb.add_text("ESP32-C6-DevKitC-1-N8 HEADERS", ex, ey - 5.08, size=3.0)
+    sb.add_text_box("", ex - 2.54, ey - 7.62, 124.46, 135.0)
+
+    # Left header J16 (1x20) - mapped to specific GPIOs
+    hx, hy = ex + 20.32, ey + 10.16
+    sb.add_symbol("Connector:Conn_01x20_Pin", "J16", "DevKit_Left",
+                  hx, hy, footprint="Connector_PinHeader_2.54mm:PinHeader_1x20_P2.54mm_Vertical")
+
+    # Label the left header pins
+    for i, (label_name, shape) in enumerate(left_pins):
+        num = str(i + 1)
+        if label_name.startswith("+") or label_name.startswith("GND"):
+            if label_name.startswith("+3V3"):
+                sb.add_power("+3V3", *_stub(sb, "J16", num, 5.08), rot=90)
+            elif label_name == "GND_L":
+                sb.add_power("GND", *_stub(sb, "J16", num, 5.08), rot=90)
+        elif label_name.startswith("~"):
+            sb.add_no_connect(*sb.pin("J16", num))
+        elif label_name == "GPIO8_RSVD":
+            sb.add_no_connect(*sb.pin("J16", num))
+        elif label_name == "GPIO14_SPARE":
+            sb.add_no_connect(*sb.pin("J16", num))
+        else:
+            sb.add_global_label(label_name, *_stub(sb, "J16", num), rot=180, shape=shape)
+
+    # Right header J17 (1x20)
+    h2x, h2y = ex + 60.96, ey + 10.16
+    sb.add_symbol("Connector:Conn_01x20_Pin", "J17", "DevKit_Right",
+                  h2x, h2y, footprint="Connector_PinHeader_2.54mm:PinHeader_1x20_P2.54mm_Vertical")
+
+    for i, (label_name, shape) in enumerate(right_pins):
+        num = str(i + 1)
+        if label_name == "+5V":
+            sb.add_power("+5V", *_stub(sb, "J17", num, 5.08), rot=90)
+        elif label_name == "GND_R":
+            sb.add_power("GND", *_stub(sb, "J17", num, 5.08), rot=90)
+        elif label_name.startswith("NC") or label_name.startswith("USB") or label_name.startswith("GPIO"):
+            sb.add_no_connect(*sb.pin("J17", num))
+        else:
+            sb.add_global_label(label_name, *_stub(sb, "J17", num), rot=180, shape=shape)
+
+
+# ===================================================================
+# SECTION 4: I2C BUS & SENSOR CONNECTORS
+# ===================================================================
+def section_i2c(sb, i2c_connectors, bnc_conns, i2c_ports=6, bnc_probes=3, **_):
+    ix, iy = 25.40, 100.0
+
+    sb.add_text("I2C BUS & SENSOR CONNECTORS", ix, iy - 5.08, size=3.0)
+    sb.add_text_box("", ix - 2.54, iy - 7.62, 100.0, 90.0)
+
+    # I2C pull-up resistors
+    sb.add_symbol("Device:R", "R3", "4.7k", ix + 5.08, iy + 5.08,
+                  footprint="Resistor_SMD:R_0805_2012Metric")
+    sb.add_power("+3V3", *sb.pin("R3", "1"), rot=0)
+    sb.add_global_label("I2C_SDA", *sb.pin("R3", "2"), rot=270)
+
+    sb.add_symbol("Device:R", "R4", "4.7k", ix + 15.24, iy + 5.08,
+                  footprint="Resistor_SMD:R_0805_2012Metric")
+    sb.add_power("+3V3", *sb.pin("R4", "1"), rot=0)
+    sb.add_global_label("I2C_SCL", *sb.pin("R4", "2"), rot=270)
+
+    # I2C bus decoupling
+    sb.add_symbol("Device:C", "C4", "100nF", ix + 25.40, iy + 5.08,
+                  footprint="Capacitor_SMD:C_0805_2012Metric")
+    sb.add_power("+3V3", *sb.pin("C4", "1"), rot=0)
+    sb.add_power("GND", *sb.pin("C4", "2"))
+
+    # I2C Sensor connectors (JST-PH 4-pin, Qwiic compatible)
+    # Pin order: GND, 3.3V, SDA, SCL
+    if i2c_ports > len(i2c_connectors):
+        raise ValueError(f"at most {len(i2c_connectors)} I2C ports")
+    for ref, val, dx, dy in i2c_connectors[:i2c_ports]:
+        cx, cy = ix + dx, iy + dy
+        sb.add_symbol("Connector:Conn_01x04_Pin", ref, val,
+                      cx, cy, footprint="Connector_JST:JST_PH_B4B-PH-K_1x04_P2.00mm_Vertical")
+        # Pin 1 = GND, Pin 2 = 3.3V, Pin 3 = SDA, Pin 4 = SCL
+        sb.add_power("GND", *_stub(sb, ref, "1"), rot=90)
+        sb.add_power("+3V3", *_stub(sb, ref, "2"), rot=90)
+        sb.add_global_label("I2C_SDA", *_stub(sb, ref, "3"), rot=180)
+        sb.add_global_label("I2C_SCL", *_stub(sb, ref, "4"), rot=180)
+
+    # BNC connectors for probes
+    sb.add_text("BNC Probe Connectors", ix + 45.72, iy + 50.80 - 5.08, size=1.5)
+    if bnc_probes > len(bnc_conns):
+        raise ValueError(f"at most {len(bnc_conns)} BNC probes")
+    for ref, val, dx, dy in bnc_conns[:bnc_probes]:
+        cx, cy = ix + dx, iy + dy
+        sb.add_symbol("Connector:Conn_01x02_Pin", ref, val,
+                      cx, cy, footprint="Connector_Coaxial:BNC_TEConnectivity_1478204_Vertical")
+        # Pin 1 = centre (to the EZO probe input), Pin 2 = shield
+        sb.add_text("To EZO PRB", cx + 3.0, cy, size=1.0)
+        sb.add_power("GND", *_stub(sb, ref, "2"), rot=90)
+
+
+# ===================================================================
+# SECTION 5: 1-WIRE, ULTRASONIC, FLOAT SWITCHES
+# ===================================================================
+def section_onewire_ultrasonic_float(sb, float_switches, **_):
+    ox, oy = 25.40, 195.0
+
+    sb.add_text("1-WIRE / ULTRASONIC / FLOAT SWITCHES", ox, oy - 5.08, size=3.0)
+    sb.add_text_box("", ox - 2.54, oy - 7.62, 100.0, 70.0)
+
+    # --- 1-Wire Section ---
+    sb.add_text("1-Wire (DS18B20)", ox, oy + 2.54, size=1.5)
+
+    # R5 - 1-Wire pull-up 4.7k
+    sb.add_symbol("Device:R", "R5", "4.7k", ox + 5.08, oy + 10.16,
+                  footprint="Resistor_SMD:R_0805_2012Metric")
+    sb.add_power("+3V3", *sb.pin("R5", "1"), rot=0)
+    sb.add_global_label("ONEWIRE", *sb.pin("R5", "2"), rot=270)
+
+    # J13 - 1-Wire connector (3-pin JST-PH: GND, DATA, 3.3V)
+    sb.add_symbol("Connector:Conn_01x03_Pin", "J13", "1-Wire",
+                  ox + 20.32, oy + 12.70,
+                  footprint="Connector_JST:JST_PH_B3B-PH-K_1x03_P2.00mm_Vertical")
+    sb.add_power("GND", *_stub(sb, "J13", "1"), rot=90)
+    sb.add_global_label("ONEWIRE", *_stub(sb, "J13", "2"), rot=180)
+    sb.add_power("+3V3", *_stub(sb, "J13", "3"), rot=90)
+
+    # --- Ultrasonic Section ---
+    sb.add_text("Ultrasonic (HC-SR04)", ox + 35.56, oy + 2.54, size=1.5)
+
+    # J14 - Ultrasonic connector (4-pin: VCC, TRIG, ECHO, GND)
+    sb.add_symbol("Connector:Conn_01x04_Pin", "J14", "HC-SR04",
+                  ox + 40.64, oy + 12.70,
+                  footprint="Connector_JST:JST_XH_B4B-XH-A_1x04_P2.50mm_Vertical")
+    sb.add_power("+5V", *_stub(sb, "J14", "1"), rot=90)
+    sb.add_global_label("US_TRIG", *_stub(sb, "J14", "2"), rot=180)
+
+    # ECHO voltage divider (5V -> 3.3V): R6=1k series, R7=2.2k to GND
+    echo_x = ox + 55.88
+    sb.add_symbol("Device:R", "R6", "1k", echo_x, oy + 12.70,
+                  footprint="Resistor_SMD:R_0805_2012Metric")
+    r6_top, r6_bot = sb.pin("R6", "1"), sb.pin("R6", "2")
+    echo_pin = sb.pin("J14", "3")
+    sb.add_wire(*echo_pin, echo_x, echo_pin[1])
+    sb.add_wire(echo_x, echo_pin[1], *r6_top)
+
+    sb.add_symbol("Device:R", "R7", "2.2k", echo_x, oy + 25.40,
+                  footprint="Resistor_SMD:R_0805_2012Metric")
+    sb.add_wire(*r6_bot, *sb.pin("R7", "1"))
+    sb.add_junction(*r6_bot)
+    sb.add_global_label("US_ECHO", r6_bot[0] + 5.08, r6_bot[1], rot=0)
+    sb.add_wire(*r6_bot, r6_bot[0] + 5.08, r6_bot[1])
+    sb.add_power("GND", *sb.pin("R7", "2"))
+
+    sb.add_power("GND", *_stub(sb, "J14", "4"), rot=90)
+
+    # --- Float Switch Section ---
+    sb.add_text("Float Switches", ox + 72.0, oy + 2.54, size=1.5)
+
+    for r_ref, r_val, c_ref, c_val, j_ref, j_val, label, dx, dy in float_switches:
+        fx2, fy2 = ox + dx, oy + dy
+        # Pull-up resistor
+        sb.add_symbol("Device:R", r_ref, r_val, fx2, fy2,
+                      footprint="Resistor_SMD:R_0805_2012Metric")
+        sb.add_power("+3V3", *sb.pin(r_ref, "1"), rot=0)
+
+        # Junction point
+        jx2, jy2 = sb.pin(r_ref, "2")
+        sb.add_junction(jx2, jy2)
+        sb.add_global_label(label, jx2 + 5.08, jy2, rot=0)
+        sb.add_wire(jx2, jy2, jx2 + 5.08, jy2)
+
+        # Debounce capacitor
+        sb.add_symbol("Device:C", c_ref, c_val, fx2, fy2 + 12.70,
+                      footprint="Capacitor_SMD:C_0805_2012Metric")
+        sb.add_wire(jx2, jy2, *sb.pin(c_ref, "1"))
+        sb.add_power("GND", *sb.pin(c_ref, "2"))
+
+        # Float switch connector (2-pin)
+        sb.add_symbol("Connector:Conn_01x02_Pin", j_ref, j_val,
+                      fx2 - 10.16, fy2 + 10.16,
+                      footprint="Connector_JST:JST_XH_B2B-XH-A_1x02_P2.50mm_Vertical")
+        # Pin 1 = switch input, Pin 2 = GND
+        sb.add_wire(*sb.pin(j_ref, "1"), jx2, jy2)
+        sb.add_power("GND", *sb.pin(j_ref, "2"))  # a stub would reach the echo divider
+
+
+# ===================================================================
+# SECTION 6: MOSFET PUMP/VALVE DRIVERS
+# ===================================================================
+def section_drivers(sb, driver_channels, drivers=6, chunk=None, **_):
+    mx, my = 270.0, 30.48
+
+    # Channels [first, last) of this chunk (all of them without one)
+    first, last = 0, drivers
+    if chunk is not None:
+        first, last = chunk * DRIVER_CHUNK, min(drivers, (chunk + 1) * DRIVER_CHUNK)
+    if first == 0:
+        sb.add_text("PUMP & VALVE DRIVERS (12V)", mx, my - 5.08, size=3.0)
+        sb.add_text_box("", mx - 2.54, my - 7.62, 145.0, 200.0 + (drivers - 6) * DRIVER_PITCH)
+
+    # Q2-Q7 IRLZ44N, gate R10/R12/.. 100R, pull-down R11/R13/.. 10k,
+    # flyback D2-D7 SS34, load connectors J2-J7
+    n = min(drivers, len(driver_channels))
+    a, b = first, min(last, n)
+    if a < b:
+        add_driver_array(sb, mx, my + 5.08 + a * DRIVER_PITCH, b - a, pitch=DRIVER_PITCH,
+                         labels=[label for label, _ in driver_channels[a:b]],
+                         loads=[load for _, load in driver_channels[a:b]],
+                         first={"Q": 2 + a, "R": 10 + 2 * a, "D": 2 + a, "J": 2 + a})
+    # Extra channels of larger variants continue below, numbered from 101
+    a, b = max(first, n), last
+    if a < b:
+        k = a - n  # extra channels before this chunk
+        add_driver_array(sb, mx, my + 5.08 + a * DRIVER_PITCH, b - a, pitch=DRIVER_PITCH,
+                         labels=[f"DRV{k + i + 1}" for i in range(b - a)],
+                         loads=[f"Load{k + i + 1}" for i in range(b - a)],
+                         first={"Q": 101 + k, "R": 101 + 2 * k, "D": 101 + k, "J": 101 + k})
+
+
+def driver_chunks(drivers=6, **_):
+    """section_drivers() is built DRIVER_CHUNK channels at a time, so large
+    variants spread over the process pool."""
+    return max(1, -(-drivers // DRIVER_CHUNK))
+
+section_drivers.chunks = driver_chunks
+
+
+# ===================================================================
+# SECTION 7: WS2812B STATUS LED
+# ===================================================================
+def section_status_led(sb, **_):
+    lx, ly = 130.0, 235.0
+
+    sb.add_text("STATUS LED", lx, ly - 5.08, size=3.0)
+    sb.add_text_box("", lx - 2.54, ly - 7.62, 60.0, 40.0)
+
+    # WS2812B
+    sb.add_symbol("LED:WS2812B", "D8", "WS2812B", lx + 20.32, ly + 10.16,
+                  footprint="LED_SMD:LED_WS2812B_PLCC4_5.0x5.0mm_P3.2mm")
+    sb.add_power("+5V", *sb.pin("D8", "1"), rot=0)
+    sb.add_power("GND", *sb.pin("D8", "3"))
+
+    # R22 - Series resistor on data line (100Ω)
+    sb.add_symbol("Device:R", "R22", "100R", lx + 5.08, ly + 10.16, rot=90,
+                  footprint="Resistor_SMD:R_0805_2012Metric")
+    sb.add_global_label("LED_DATA", *sb.pin("R22", "1"), rot=180)
+    sb.add_wire(*sb.pin("R22", "2"), *sb.pin("D8", "4"))
+
+    # C7 - Decoupling cap (100nF)
+    sb.add_symbol("Device:C", "C7", "100nF", lx + 35.56, ly + 10.16,
+                  footprint="Capacitor_SMD:C_0805_2012Metric")
+    sb.add_power("+5V", *sb.pin("C7", "1"), rot=0)
+    sb.add_power("GND", *sb.pin("C7", "2"))
+
+    # DOUT - no connect (single LED)
+    sb.add_no_connect(*sb.pin("D8", "2"))
+
+
+# ===================================================================
+# SECTION 8: TEST POINTS
+# ===================================================================
+def section_test_points(sb, test_point_nets, drivers=6, test_points="all", **_):
+    if test_points == "none":
+        return
+    tx, ty = 270.0, 240.0 + max(0, drivers - 6) * DRIVER_PITCH  # below the drivers
+
+    sb.add_text("TEST POINTS", tx, ty - 5.08, size=3.0)
+    sb.add_text_box("", tx - 2.54, ty - 7.62, 80.0, 30.0)
+
+    tps = test_point_nets
+    if test_points == "power":
+        tps = tps[:4]
+    elif test_points != "all":
+        raise ValueError(f"test_points must be 'all', 'power' or 'none', not {test_points!r}")
+    for i, (ref, val, net) in enumerate(tps):
+        tpx = tx + 5.08 + i * 10.16
+        tpy = ty + 10.16
+        sb.add_symbol("Connector:TestPoint", ref, val, tpx, tpy,
+                      footprint="TestPoint:TestPoint_Pad_1.0x1.0mm")
+        # The pin is below the pad: rails hang off a short wire
+        px, py = sb.pin(ref, "1")
+        if net in ("+3V3", "+5V", "+12V"):
+            sb.add_power(net, px, py + 2.54, rot=180)
+            sb.add_wire(px, py, px, py + 2.54)
+        elif net == "GND":
+            sb.add_power("GND", px, py + 2.54)
+            sb.add_wire(px, py, px, py + 2.54)
+        else:
+            sb.add_global_label(net, px, py, rot=270)
+
+
+# Sections in the order they are written to the schematic
+SECTIONS = (
+    section_power_input,
+    section_regulators,
+    section_devkit_headers,
+    section_i2c,
+    section_onewire_ultrasonic_float,
+    section_drivers,
+    section_status_led,
+    section_test_points,
+)
+
+
+def build_schematic(board_dir, params, jobs=1, cache_dir=None):
+    """Build the revision in `board_dir` with section parameters `params`
+    (see PARAMS in its generate_schematic.py)."""
+    # The project's own parts, as lib_ids "Coert-Vonk:<name>", from this
+    # revision's copy of the library
+    add_symbol_library("Coert-Vonk", os.path.join(board_dir, "library copies",
+                                                  "Coert-Vonk.kicad_sym"))
+    tables = load_design(os.path.join(board_dir, params["design"]), DESIGN_SCHEMA,
+                         cache_dir=cache_dir)
+    return build_sections(SECTIONS, jobs=jobs, cache_dir=cache_dir,
+                          params={**tables, **params})
@@ -0,0 +1,20 @@
+"""
+Shared KiCad schematic generator for the OPNhydro board revisions.
+
+Each board directory (OPNhydro_r1, OPNhydro_r2, ...) keeps a
+generate_schematic.py with its parameters and a design.json with its data
+tables; the section functions that place the parts are in ../opnhydro.py
+while the revisions share them, and this package holds everything else they
+have in common.
+"""
+
+from .builder import SchematicBuilder, stable_uuid, UUID_NAMESPACE
+from .items import (Symbol, Power, Label, Wire, Junction, NoConnect, Text, Rect,
+                    RawItem)
+from .library import (lib_sym_for, lib_sym_pins, lib_sym_pin_offsets,
+                      add_symbol_library)
+from .blocks import add_driver_array
+from .sections import build_sections, section_keys, CACHE_DIRNAME
+from .writer import (iter_schematic, iter_lib_symbols, write_schematic,
+                     write_if_changed, generate)
+from .cli import board_main, generate_all, OUTPUT_NAME
@@ -0,0 +1,117 @@
+"""
+Multi-channel circuit blocks.
+
+A block places the same circuit once per channel in a column.  Channel
+positions and references are worked out for the whole column up front, and
+every wire is drawn between pin positions from the library symbols, so a
+block stays connected whatever the channel count.
+"""
+
+from .units import to_mm
+from .library import lib_sym_pin_offsets
+
+MOSFET = "Device:Q_NMOS_GDS"
+RESISTOR = "Device:R"
+DIODE = "Device:D_Schottky"
+CONNECTOR = "Connector:Conn_01x02_Pin"
+
+
+def _channel_names(names, channels):
+    """`names` as a list: a "{n}" pattern is formatted with 1-based channel
+    numbers, a sequence is used as is."""
+    if isinstance(names, str):
+        return [names.format(n=n) for n in range(1, channels + 1)]
+    names = list(names)
+    if len(names) != channels:
+        raise ValueError(f"{len(names)} names for {channels} channels")
+    return names
+
+
+def _pin(lib_id, num, x, y, rot=0):
+    """Pin `num` of a `lib_id` placed at (x, y), in mm."""
+    dx, dy = lib_sym_pin_offsets(lib_id, rot)[num]
+    return x + to_mm(dx), y + to_mm(dy)
+
+
+def add_driver_array(sb, x, y, channels, pitch=30.48, labels="DRV{n}", loads="Load{n}",
+                     first=None, mosfet="IRLZ44N", diode="SS34"):
+    """Add `channels` low-side MOSFET load drivers, one every `pitch` mm
+    down from (x, y).
+
+    Each channel is a gate resistor from global label `labels`, a gate
+    pull-down, an N-MOSFET switching the load's low side, a flyback diode
+    to +12V and a 2-pin load connector (pin 1 = +12V, pin 2 = drain).
+    `labels` and `loads` (connector values) are "{n}" patterns or one name
+    per channel.  References are annotated in channel order starting at
+    `first` ({"Q": 2, "R": 10, ...}, default 1): Q, gate R, pull-down R, D
+    and J per channel.  Returns the next free number for each prefix.
+    """
+    labels = _channel_names(labels, channels)
+    loads = _channel_names(loads, channels)
+    nxt = {"Q": 1, "R": 1, "D": 1, "J": 1}
+    nxt.update(first or {})
+    q0, r0, d0, j0 = nxt["Q"], nxt["R"], nxt["D"], nxt["J"]
+
+    # Per-channel columns
+    ys = [y + i * pitch for i in range(channels)]
+    q_refs = [f"Q{q0 + i}" for i in range(channels)]
+    rg_refs = [f"R{r0 + 2 * i}" for i in range(channels)]
+    rpd_refs = [f"R{r0 + 2 * i + 1}" for i in range(channels)]
+    d_refs = [f"D{d0 + i}" for i in range(channels)]
+    j_refs = [f"J{j0 + i}" for i in range(channels)]
+
+    # Part positions relative to the column, and their pins
+    qx = x + 40.64
+    rg_x, rpd_x, d_x, j_x = qx - 17.78, qx - 10.16, qx + 15.24, qx + 30.48
+    gx, gy = _pin(MOSFET, "1", qx, 0)
+    dx, dy = _pin(MOSFET, "2", qx, 0)
+    sx, sy = _pin(MOSFET, "3", qx, 0)
+    rg_in = _pin(RESISTOR, "1", rg_x, 0, 90)
+    rg_out = _pin(RESISTOR, "2", rg_x, 0, 90)
+    rpd_top_y = _pin(RESISTOR, "1", rpd_x, 10.16)[1]
+    rpd_bot_y = _pin(RESISTOR, "2", rpd_x, 10.16)[1]
+    k_y = _pin(DIODE, "1", d_x, 0, 90)[1]
+    a_y = _pin(DIODE, "2", d_x, 0, 90)[1]
+    j1x, j1y = _pin(CONNECTOR, "1", j_x, 0)
+    j2x, j2y = _pin(CONNECTOR, "2", j_x, 0)
+    tap_x = j2x - 5.08  # drain run down to connector pin 2
+
+    for cy, q_ref, rg_ref, rpd_ref, d_ref, j_ref, label, load in zip(
+            ys, q_refs, rg_refs, rpd_refs, d_refs, j_refs, labels, loads):
+        # MOSFET, gate resistor and pull-down
+        sb.add_symbol(MOSFET, q_ref, mosfet, qx, cy,
+                      footprint="Package_TO_SOT_THT:TO-220-3_Vertical")
+        sb.add_symbol(RESISTOR, rg_ref, "100R", rg_x, cy, rot=90,
+                      footprint="Resistor_SMD:R_0805_2012Metric")
+        sb.add_wire(rg_out[0], cy + rg_out[1], gx, cy + gy)
+        sb.add_global_label(label, rg_in[0], cy + rg_in[1], rot=180)
+        sb.add_symbol(RESISTOR, rpd_ref, "10k", rpd_x, cy + 10.16,
+                      footprint="Resistor_SMD:R_0805_2012Metric")
+        sb.add_wire(rpd_x, cy + rpd_top_y, rpd_x, cy + gy)
+        sb.add_junction(rpd_x, cy + gy)
+        sb.add_power("GND", rpd_x, cy + rpd_bot_y)
+
+        # Source to GND
+        sb.add_wire(sx, cy + sy, sx, cy + sy + 2.54)
+        sb.add_power("GND", sx, cy + sy + 2.54)
+
+        # Drain to the diode anode and connector pin 2
+        sb.add_symbol(DIODE, d_ref, diode, d_x, cy, rot=90,
+                      footprint="Diode_SMD:D_SMA_Handsoldering")
+        sb.add_wire(dx, cy + dy, d_x, cy + dy)
+        sb.add_wire(d_x, cy + dy, tap_x, cy + dy)
+        sb.add_wire(d_x, cy + a_y, d_x, cy + dy)
+        sb.add_junction(d_x, cy + dy)
+        sb.add_wire(tap_x, cy + dy, tap_x, cy + j2y)
+        sb.add_wire(tap_x, cy + j2y, j2x, cy + j2y)
+
+        # Diode cathode and connector pin 1 to +12V
+        sb.add_wire(d_x, cy + k_y, d_x, cy + k_y + 2.54)
+        sb.add_power("+12V", d_x, cy + k_y + 2.54, rot=180)
+        sb.add_symbol(CONNECTOR, j_ref, load, j_x, cy,
+                      footprint="Connector_Phoenix_MSTB:PhoenixContact_MSTBA_2,5_2-G-5,08_1x02_P5.08mm_Horizontal")
+        sb.add_wire(j1x, cy + j1y, j1x - 2.54, cy + j1y)
+        sb.add_power("+12V", j1x - 2.54, cy + j1y, rot=90)
+
+    return {"Q": q0 + channels, "R": r0 + 2 * channels,
+            "D": d0 + channels, "J": j0 + channels}
@@ -0,0 +1,111 @@
+"""
+Bill of materials straight from a SchematicBuilder.
+
+The builder groups components by (value, footprint, extra properties) as
+they are added (SchematicBuilder.bom), so writing the BOM is one pass over
+the groups.  Rows are streamed to the CSV in the columns and order of
+KiCad's grouped "Value+Footprint" export, like the committed
+"OPNhydro_r1 BOM.csv".  check_bom() streams a committed CSV against the
+generated rows and reports the groups that differ.
+
+Run: python -m schgen.bom [board ...] [--check]    (from hardware/)
+"""
+
+import argparse
+import csv
+import os
+import sys
+
+from .netlist import natural_key
+
+COLUMNS = ("Reference", "Qty", "Value", "DNP", "Exclude from BOM",
+           "Exclude from Board", "Footprint", "Datasheet", "DKPN")
+
+
+def iter_bom(sb):
+    """Yield one row (tuple in COLUMNS order) per BOM group, ordered by
+    first reference as KiCad does (C1, C3, ..., R2, R10)."""
+    groups = [(sorted(refs, key=natural_key), key) for key, refs in sb.bom.items()]
+    groups.sort(key=lambda g: natural_key(g[0][0]))
+    for refs, (value, footprint, props) in groups:
+        props = dict(props)
+        yield (",".join(refs), str(len(refs)), value, "", "", "", footprint,
+               props.get("Datasheet", "~"), props.get("DKPN", ""))
+
+
+def write_bom(f, sb):
+    """Write the grouped BOM of `sb` to text file `f`; return the row count."""
+    writer = csv.writer(f, quoting=csv.QUOTE_ALL, lineterminator="\n")
+    writer.writerow(COLUMNS)
+    n = 0
+    for row in iter_bom(sb):
+        writer.writerow(row)
+        n += 1
+    return n
+
+
+def check_bom(sb, path):
+    """Yield a line for every group that differs between `sb` and the BOM
+    CSV at `path`, matched on (Value, Footprint): "-" only in the file,
+    "+" only generated, "~" in both with other differences.  Generated
+    groups that share a Value and Footprint (other extra properties) are
+    all kept: a file row takes the one it equals, or else the first, and
+    the rest are reported as "+"."""
+    generated = {}  # (Value, Footprint) -> [row, ...]
+    for row in iter_bom(sb):
+        generated.setdefault((row[2], row[6]), []).append(row)
+    with open(path, newline="", encoding="utf-8") as f:
+        reader = csv.reader(f)
+        header = next(reader, None)
+        if header is None or tuple(header[:len(COLUMNS)]) != COLUMNS:
+            raise ValueError(f"{path}: not a grouped BOM with columns {', '.join(COLUMNS)}")
+        for row in reader:
+            row = tuple(row[:len(COLUMNS)])
+            candidates = generated.get((row[2], row[6]))
+            if not candidates:
+                yield f"- {row[0]} {row[2]!r} {row[6]!r}"
+                continue
+            ours = row if row in candidates else candidates[0]
+            candidates.remove(ours)
+            if ours != row:
+                changed = ", ".join(f"{col} {a!r} -> {b!r}"
+                                    for col, a, b in zip(COLUMNS, row, ours) if a != b)
+                yield f"~ {row[2]!r} {row[6]!r}: {changed}"
+    for rows in generated.values():
+        for row in rows:
+            yield f"+ {row[0]} {row[2]!r} {row[6]!r}"
+
+
+def main(argv=None):
+    from .cli import HARDWARE_DIR, OUTPUT_NAME, find_boards, load_board
+    parser = argparse.ArgumentParser(
+        prog="python -m schgen.bom",
+        description="Write or check the grouped BOM of each board.")
+    parser.add_argument("boards", nargs="*", help="board directories (default: all)")
+    parser.add_argument("--check", action="store_true",
+                        help="compare with the committed '<board> BOM.csv' instead of writing")
+    args = parser.parse_args(argv)
+    status = 0
+    for name in args.boards or find_boards():
+        board_dir = os.path.join(HARDWARE_DIR, name)
+        sb = load_board(name).build_schematic()
+        if args.check:
+            committed = os.path.join(board_dir, f"{name} BOM.csv")
+            if not os.path.exists(committed):
+                print(f"# {name}: no committed BOM to check against")
+                continue
+            diffs = list(check_bom(sb, committed))
+            print(f"# {name}: {len(diffs)} group(s) differ from {os.path.relpath(committed)}")
+            for line in diffs:
+                print(line)
+            status = status or bool(diffs)
+        else:
+            path = os.path.join(board_dir, f"{os.path.splitext(OUTPUT_NAME)[0]} BOM.csv")
+            with open(path, "w", newline="", encoding="utf-8") as f:
+                rows = write_bom(f, sb)
+            print(f"Generated: {os.path.relpath(path)} ({rows} groups)")
+    return int(status)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
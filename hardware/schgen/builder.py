@@ -0,0 +1,160 @@
+"""SchematicBuilder: collects item records with identity-derived UUIDs."""
+
+import uuid
+
+from .items import Symbol, Power, Label, Wire, Junction, NoConnect, Text, Rect
+from .library import lib_sym_pins, lib_sym_pin_offsets
+from .units import mm, to_nm, to_mm
+
+# ---------------------------------------------------------------------------
+# UUID helper
+# ---------------------------------------------------------------------------
+# UUIDs are derived from item identity (reference, pin, position), so they
+# stay put when unrelated items are added or moved.
+UUID_NAMESPACE = uuid.uuid5(uuid.NAMESPACE_URL, "https://github.com/cvonk/OPNhydroponics")
+
+def stable_uuid(key, namespace=UUID_NAMESPACE):
+    return str(uuid.uuid5(namespace, key))
+
+def pos_key(x, y):
+    """Identity text of a position in nanometres (as written: 0.01 mm)."""
+    return f"{mm(x)},{mm(y)}"
+
+
+# ---------------------------------------------------------------------------
+# Component instance builders
+# ---------------------------------------------------------------------------
+# Board code works in millimetres; records hold integer nanometres, which the
+# add_* methods convert on the way in.
+class SchematicBuilder:
+    def __init__(self, namespace=UUID_NAMESPACE):
+        self.items = []  # All schematic items (Symbol, Wire, Label, ... records)
+        self.symbols = {}  # ref -> Symbol, for components (not power symbols)
+        self.pwr_idx = 0
+        self.namespace = namespace
+        self._uuid_keys = {}  # identity key -> times used
+        # BOM groups as components are added: (value, footprint, extra
+        # properties) -> [ref, ...]
+        self.bom = {}
+
+    def new_uuid(self, key):
+        """Return the UUID for identity `key`; repeats get a #n suffix."""
+        n = self._uuid_keys.get(key, 0) + 1
+        self._uuid_keys[key] = n
+        if n > 1:
+            key = f"{key}#{n}"
+        return stable_uuid(key, self.namespace)
+
+    def merge(self, other):
+        """Append the items of builder `other` as if they were added here.
+
+        Power references are renumbered, and UUIDs whose identity key was
+        already used here get the #n suffix a serial build would give them.
+        """
+        for key, refs in other.bom.items():
+            self.bom.setdefault(key, []).extend(refs)
+        remap = {}
+        for key, count in other._uuid_keys.items():
+            used = self._uuid_keys.get(key, 0)
+            if used:
+                for n in range(1, count + 1):
+                    old = stable_uuid(key if n == 1 else f"{key}#{n}", other.namespace)
+                    remap[old] = stable_uuid(f"{key}#{used + n}", self.namespace)
+            self._uuid_keys[key] = used + count
+        for item in other.items:
+            if isinstance(item, Power):
+                item.ref = self._flg_ref() if item.value == "PWR_FLAG" else self._pwr_ref()
+            elif isinstance(item, Symbol):
+                self.symbols[item.ref] = item
+            if remap:
+                item.uuid = remap.get(item.uuid, item.uuid)
+                if isinstance(item, Symbol):
+                    item.pins = tuple((p, remap.get(u, u)) for p, u in item.pins)
+            self.items.append(item)
+
+    def _pwr_ref(self):
+        self.pwr_idx += 1
+        return f"#PWR{self.pwr_idx:03d}"
+
+    def _flg_ref(self):
+        self.pwr_idx += 1
+        return f"#FLG{self.pwr_idx:03d}"
+
+    def add_symbol(self, lib_id, ref, value, x, y, rot=0, footprint="",
+                   pin_uuids=None, mirror=False, extra_props=None):
+        """Add a component instance."""
+        x, y = to_nm(x), to_nm(y)
+        uid = self.new_uuid(f"symbol:{ref}")
+        if pin_uuids:
+            pins = tuple(pin_uuids.items())
+        else:
+            # One entry per pin of the library symbol
+            pins = tuple((p, self.new_uuid(f"pin:{ref}:{p}"))
+                         for p in lib_sym_pins(lib_id))
+        sym = Symbol(lib_id, ref, value, x, y, rot, footprint, mirror,
+                     extra_props, pins, uid)
+        self.items.append(sym)
+        self.symbols[ref] = sym
+        props = tuple(sorted(extra_props.items())) if extra_props else ()
+        self.bom.setdefault((value, footprint, props), []).append(ref)
+        return uid
+
+    def pin(self, ref, num):
+        """(x, y) in mm of pin `num` of component `ref`, where its wire
+        connects."""
+        sym = self.symbols[ref]
+        dx, dy = lib_sym_pin_offsets(sym.lib_id, sym.rot, sym.mirror)[num]
+        return to_mm(sym.x + dx), to_mm(sym.y + dy)
+
+    def pins(self, ref):
+        """{pin number: (x, y) in mm} for every pin of component `ref`."""
+        sym = self.symbols[ref]
+        return {num: (to_mm(sym.x + dx), to_mm(sym.y + dy)) for num, (dx, dy)
+                in lib_sym_pin_offsets(sym.lib_id, sym.rot, sym.mirror).items()}
+
+    def add_power(self, name, x, y, rot=0):
+        """Add a power symbol (GND, +12V, +5V, +3.3V)."""
+        x, y = to_nm(x), to_nm(y)
+        key = f"power:{name}@{pos_key(x, y)}"
+        uid = self.new_uuid(key)
+        if name == "PWR_FLAG":
+            ref = self._flg_ref()
+        else:
+            ref = self._pwr_ref()
+        pins = (("1", self.new_uuid(f"pin:{key}")),)
+        self.items.append(Power(f"power:{name}", ref, name, x, y, rot, "",
+                                False, None, pins, uid))
+
+    def add_global_label(self, name, x, y, rot=0, shape="passive"):
+        """Add a global label."""
+        x, y = to_nm(x), to_nm(y)
+        uid = self.new_uuid(f"label:{name}@{pos_key(x, y)}")
+        self.items.append(Label(name, x, y, rot, shape, uid))
+
+    def add_wire(self, x1, y1, x2, y2):
+        """Add a wire segment."""
+        x1, y1, x2, y2 = to_nm(x1), to_nm(y1), to_nm(x2), to_nm(y2)
+        ends = sorted((pos_key(x1, y1), pos_key(x2, y2)))
+        uid = self.new_uuid(f"wire:{ends[0]}-{ends[1]}")
+        self.items.append(Wire(x1, y1, x2, y2, uid))
+
+    def add_junction(self, x, y):
+        x, y = to_nm(x), to_nm(y)
+        uid = self.new_uuid(f"junction@{pos_key(x, y)}")
+        self.items.append(Junction(x, y, uid))
+
+    def add_no_connect(self, x, y):
+        x, y = to_nm(x), to_nm(y)
+        uid = self.new_uuid(f"no_connect@{pos_key(x, y)}")
+        self.items.append(NoConnect(x, y, uid))
+
+    def add_text(self, text, x, y, size=2.54):
+        x, y = to_nm(x), to_nm(y)
+        uid = self.new_uuid(f"text:{text}@{pos_key(x, y)}")
+        self.items.append(Text(text, x, y, size, uid))
+
+    def add_text_box(self, text, x, y, w, h, size=1.27):
+        """Add a dashed text box (section border)."""
+        x, y, w, h = to_nm(x), to_nm(y), to_nm(w), to_nm(h)
+        uid = self.new_uuid(f"rect@{pos_key(x, y)}+{pos_key(w, h)}")
+        self.items.append(Rect(x, y, w, h, uid))
@@ -0,0 +1,78 @@
+"""
+Pickled caches of values derived from source files (indexes, compiled
+design tables).
+
+An entry is a (stamp, value) pickle.  The stamp is the source file's
+(mtime_ns, size) plus anything else the value depends on, and the value is
+rebuilt when the stamp no longer matches.  Files are written to a
+temporary name and renamed into place, so a concurrent run never reads
+half a pickle, and entries are kept in memory for repeated use in one
+process.
+"""
+
+import os
+import pickle
+
+# Unreadable, truncated or out-of-date pickles (a class that moved) alike
+# just mean "rebuild"
+_LOAD_ERRORS = (OSError, pickle.UnpicklingError, EOFError, ValueError,
+                AttributeError, ImportError)
+
+
+def file_stamp(path, *extra):
+    """(mtime_ns, size, *extra) of the file at `path`."""
+    st = os.stat(path)
+    return (st.st_mtime_ns, st.st_size) + extra
+
+
+def unpickle(data):
+    """The object pickled in bytes `data`, or None if it cannot be loaded."""
+    try:
+        return pickle.loads(data)
+    except _LOAD_ERRORS:
+        return None
+
+
+def read_pickle(path):
+    """The object pickled at `path`, or None if it cannot be loaded."""
+    try:
+        with open(path, "rb") as f:
+            data = f.read()
+    except OSError:
+        return None
+    return unpickle(data)
+
+
+def write_atomic(path, data):
+    """Write bytes `data` to `path` through a temporary file, creating its
+    directory if needed."""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, "wb") as f:
+        f.write(data)
+    os.replace(tmp, path)
+
+
+def write_pickle(path, obj):
+    write_atomic(path, pickle.dumps(obj, protocol=pickle.HIGHEST_PROTOCOL))
+
+
+_memo = {}  # cache path -> (stamp, value)
+
+def cached(cache_path, stamp, build):
+    """The value of build() for `stamp`: from memory, else from the pickle
+    at `cache_path` if it was saved with the same stamp, else built now
+    and saved there.  With `cache_path` None it is simply built."""
+    if cache_path is None:
+        return build()
+    hit = _memo.get(cache_path)
+    if hit is not None and hit[0] == stamp:
+        return hit[1]
+    saved = read_pickle(cache_path)
+    if isinstance(saved, tuple) and len(saved) == 2 and saved[0] == stamp:
+        value = saved[1]
+    else:
+        value = build()
+        write_pickle(cache_path, (stamp, value))
+    _memo[cache_path] = (stamp, value)
+    return value
@@ -0,0 +1,147 @@
+"""
+Command-line entry points.
+
+board_main() backs each board's `python generate_schematic.py`; main() backs
+`python -m schgen`, which generates every board revision and its variants in
+one process so the library symbol and section caches are shared.
+"""
+
+import argparse
+import importlib
+import os
+import sys
+import time
+
+from .fpcache import check_footprints
+from .merge import merge_file
+from .sections import CACHE_DIRNAME
+from .writer import write_if_changed
+
+OUTPUT_NAME = "hydroponics-controller.kicad_sch"
+HARDWARE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _add_build_args(parser):
+    parser.add_argument("-j", "--jobs", type=int, default=1,
+                        help="build sections in a pool of JOBS processes")
+    parser.add_argument("--no-cache", action="store_true",
+                        help=f"rebuild every section instead of using {CACHE_DIRNAME}/")
+    parser.add_argument("--watch", action="store_true",
+                        help="stay running and regenerate when the board file changes")
+
+
+def _cache_dir(board_dir, variant, use_cache):
+    if not use_cache:
+        return None
+    if variant:
+        return os.path.join(board_dir, CACHE_DIRNAME, variant)
+    return os.path.join(board_dir, CACHE_DIRNAME)
+
+
+def _output_path(board_dir, variant):
+    if variant:
+        stem, ext = os.path.splitext(OUTPUT_NAME)
+        return os.path.join(board_dir, f"{stem}-{variant}{ext}")
+    return os.path.join(board_dir, OUTPUT_NAME)
+
+
+def board_main(build_schematic, board_dir, argv=None):
+    """Generate one board's schematic into `board_dir`."""
+    parser = argparse.ArgumentParser(description="Generate the OPNhydro schematic.")
+    _add_build_args(parser)
+    parser.add_argument("--merge", nargs="?", const=True, metavar="FILE",
+                        help="keep the layout of FILE as edited in KiCad "
+                             f"(default: the existing {OUTPUT_NAME})")
+    args = parser.parse_args(argv)
+    if args.watch:
+        from .watch import watch
+        watch([os.path.basename(board_dir)], os.path.dirname(board_dir),
+              jobs=args.jobs, merge=args.merge)
+        return
+    out_path = _output_path(board_dir, "")
+    try:
+        sb = build_schematic(jobs=args.jobs,
+                             cache_dir=_cache_dir(board_dir, "", not args.no_cache))
+        check_footprints(sb, board_dir, use_cache=not args.no_cache)
+    except ValueError as e:
+        sys.exit(f"error: {e}")
+    if args.merge:
+        layout = out_path if args.merge is True else args.merge
+        if os.path.exists(layout):
+            moved, added = merge_file(sb, layout)
+            print(f"Merged layout of {layout}: {moved} item(s) moved, {added} added")
+    if not write_if_changed(out_path, sb):
+        print(f"Unchanged: {out_path}")
+        return
+    print(f"Generated: {out_path}")
+    print(f"Components and nets written successfully.")
+    print(f"Open in KiCad 8.0+ to view and refine layout.")
+
+
+# ---------------------------------------------------------------------------
+# All boards
+# ---------------------------------------------------------------------------
+def find_boards(root=HARDWARE_DIR):
+    """Board directories under `root` that have a generate_schematic.py."""
+    return sorted(d for d in os.listdir(root)
+                  if os.path.isfile(os.path.join(root, d, "generate_schematic.py")))
+
+
+def load_board(name, root=HARDWARE_DIR):
+    """Import `<name>/generate_schematic.py` as module `<name>.generate_schematic`."""
+    if root not in sys.path:
+        sys.path.insert(0, root)
+    return importlib.import_module(f"{name}.generate_schematic")
+
+
+def board_variants(module):
+    """(variant, params) for the board's default build, followed by every
+    entry of its optional VARIANTS dict (name -> section parameters)."""
+    yield "", {}
+    yield from getattr(module, "VARIANTS", {}).items()
+
+
+def generate_all(boards=None, jobs=1, use_cache=True, root=HARDWARE_DIR, merge=False):
+    """Generate every variant of every board; yield (path, written, seconds).
+    With `merge`, each output keeps the layout of the existing file.
+
+    Raises ValueError, before writing, for a footprint that is not in the
+    board's fp-info-cache."""
+    for name in boards or find_boards(root):
+        module = load_board(name, root)
+        board_dir = os.path.join(root, name)
+        for variant, params in board_variants(module):
+            t0 = time.perf_counter()
+            sb = module.build_schematic(jobs=jobs,
+                                        cache_dir=_cache_dir(board_dir, variant, use_cache),
+                                        **params)
+            check_footprints(sb, board_dir, use_cache=use_cache)
+            out_path = _output_path(board_dir, variant)
+            if merge and os.path.exists(out_path):
+                merge_file(sb, out_path)
+            written = write_if_changed(out_path, sb)
+            yield out_path, written, time.perf_counter() - t0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m schgen",
+        description="Generate the schematics of all OPNhydro board revisions.")
+    parser.add_argument("boards", nargs="*",
+                        help="board directories to generate (default: all)")
+    _add_build_args(parser)
+    parser.add_argument("--merge", action="store_true",
+                        help="keep the layout of the existing files as edited in KiCad")
+    args = parser.parse_args(argv)
+    if args.watch:
+        from .watch import watch
+        watch(args.boards or find_boards(), jobs=args.jobs, merge=args.merge)
+        return
+    try:
+        for path, written, dt in generate_all(args.boards, jobs=args.jobs,
+                                              use_cache=not args.no_cache,
+                                              merge=args.merge):
+            status = "Generated" if written else "Unchanged"
+            print(f"{status}: {os.path.relpath(path)} ({dt * 1e3:.1f} ms)")
+    except ValueError as e:
+        sys.exit(f"error: {e}")
@@ -0,0 +1,88 @@
+"""
+Design files: a board's data tables (header pin-outs, connector lists, ...)
+kept in JSON next to its generate_schematic.py instead of in the code.
+
+A board describes its tables with a schema, {table: ((column, type), ...)},
+and every table is a list of rows, one value per column:
+
+    {"test_points": [["TP1", "+3V3", "+3V3"], ["TP2", "+5V", "+5V"]]}
+
+Keys starting with "_" are comments.  load_design() checks the file
+against the schema and compiles it to {table: tuple of row tuples}, which
+is pickled in the board's section cache, if the build has one, and reused
+until the file (or the schema) changes.  The files read are recorded for
+watch mode (see take_loaded()).
+"""
+
+import json
+import os
+
+from .cache import cached, file_stamp
+
+_TYPE_NAMES = {str: "string", float: "number", int: "integer", bool: "boolean"}
+
+_loaded = set()  # absolute paths read by load_design() since take_loaded()
+
+
+def compile_design(data, schema, source="design"):
+    """{table: ((value, ...), ...)} from decoded JSON `data`, checked
+    against `schema`.  Raises ValueError naming `source` on a mismatch."""
+    if not isinstance(data, dict):
+        raise ValueError(f"{source}: expected an object of tables")
+    unknown = [k for k in data if k not in schema and not k.startswith("_")]
+    if unknown:
+        raise ValueError(f"{source}: unknown table(s) {', '.join(unknown)}")
+    tables = {}
+    for table, columns in schema.items():
+        if table not in data:
+            raise ValueError(f"{source}: missing table {table!r}")
+        rows = data[table]
+        if not isinstance(rows, list):
+            raise ValueError(f"{source}: {table}: expected a list of rows")
+        compiled = []
+        for i, row in enumerate(rows):
+            where = f"{source}: {table}[{i}]"
+            if not isinstance(row, list) or len(row) != len(columns):
+                names = ", ".join(name for name, _ in columns)
+                raise ValueError(f"{where}: expected [{names}]")
+            values = []
+            for value, (name, kind) in zip(row, columns):
+                if kind is float and isinstance(value, int) and not isinstance(value, bool):
+                    value = float(value)
+                if not isinstance(value, kind) or (kind is not bool and isinstance(value, bool)):
+                    raise ValueError(f"{where}: {name} must be a {_TYPE_NAMES[kind]}, "
+                                     f"not {value!r}")
+                values.append(value)
+            compiled.append(tuple(values))
+        tables[table] = tuple(compiled)
+    return tables
+
+
+def load_design(path, schema, cache_dir=None):
+    """Compiled tables of the design file at `path` (see compile_design()).
+    The compiled form is kept in `cache_dir`, normally the build's section
+    cache, and rebuilt when the file or `schema` changes.  With `cache_dir`
+    None the file is compiled on every call and nothing is written."""
+    _loaded.add(os.path.abspath(path))
+    cache_path = None
+    if cache_dir is not None:
+        cache_path = os.path.join(cache_dir, os.path.basename(path) + ".pickle")
+    stamp = file_stamp(path, repr([(t, [(n, k.__name__) for n, k in cols])
+                                   for t, cols in schema.items()]))
+    return cached(cache_path, stamp, lambda: _compile_file(path, schema))
+
+
+def take_loaded():
+    """The design files load_design() has read since the previous call."""
+    paths = set(_loaded)
+    _loaded.clear()
+    return paths
+
+
+def _compile_file(path, schema):
+    with open(path, encoding="utf-8") as f:
+        try:
+            data = json.load(f)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"{path}: {e}") from None
+    return compile_design(data, schema, path)
@@ -0,0 +1,124 @@
+"""
+Semantic diff of two .kicad_sch files.
+
+Components are matched by reference (and unit), everything else by kind and
+position, so the report lists parts that were added, removed, moved or
+changed and nets whose pins differ, rather than the thousands of text lines
+a reformat or a UUID change touches.  Both files are streamed through
+schfile.read_schematic(); memory grows with the item count, not file size.
+
+Run: python -m schgen.diff OLD.kicad_sch NEW.kicad_sch [--no-nets]
+"""
+
+import argparse
+import sys
+
+from .items import Power, Label, Wire, Junction, NoConnect
+from .netlist import natural_key, extract_netlist
+from .schfile import read_schematic
+from .units import mm
+
+_KINDS = ((Wire, "wire"), (Junction, "junction"), (NoConnect, "no-connect"),
+          (Label, "label"), (Power, "power symbol"))
+
+
+def _name(sym):
+    return sym.ref if sym.unit == 1 else f"{sym.ref} unit {sym.unit}"
+
+def _place(sym):
+    mirror = f" mirror {sym.mirror}" if sym.mirror else ""
+    return f"({mm(sym.x)}, {mm(sym.y)}) {sym.rot}°{mirror}"
+
+
+def diff_components(old, new):
+    """Yield "-", "+" and "~" lines for components only in `old`, only in
+    `new`, and in both but moved or with another lib_id, value or
+    footprint."""
+    def key(k):
+        return natural_key(k[0]), k[1]
+    for k in sorted(old.symbols.keys() | new.symbols.keys(), key=key):
+        a, b = old.symbols.get(k), new.symbols.get(k)
+        if b is None:
+            yield f"- {_name(a)} {a.value!r} {a.lib_id!r} at {_place(a)}"
+        elif a is None:
+            yield f"+ {_name(b)} {b.value!r} {b.lib_id!r} at {_place(b)}"
+        else:
+            changes = [f"{field} {getattr(a, field)!r} -> {getattr(b, field)!r}"
+                       for field in ("lib_id", "value", "footprint")
+                       if getattr(a, field) != getattr(b, field)]
+            if (a.x, a.y, a.rot, a.mirror) != (b.x, b.y, b.rot, b.mirror):
+                changes.append(f"moved {_place(a)} -> {_place(b)}")
+            if changes:
+                yield f"~ {_name(a)}: " + ", ".join(changes)
+
+
+def _item_key(item):
+    if isinstance(item, Wire):
+        return min((item.x1, item.y1, item.x2, item.y2), (item.x2, item.y2, item.x1, item.y1))
+    if isinstance(item, Label):
+        return item.name, item.x, item.y
+    if isinstance(item, Power):
+        return item.value, item.x, item.y
+    return item.x, item.y
+
+def diff_items(old, new):
+    """Yield one "kind: -removed +added" line per kind of positional item
+    (wires, junctions, ...) whose set differs between the files."""
+    for cls, kind in _KINDS:
+        a = {_item_key(item) for item in old.items if type(item) is cls}
+        b = {_item_key(item) for item in new.items if type(item) is cls}
+        if a != b:
+            yield f"{kind}s: -{len(a - b)} +{len(b - a)} ({len(a & b)} unchanged)"
+
+
+def diff_nets(old, new):
+    """Yield "-", "+" and "~" lines for nets, by name, whose pins differ."""
+    a = extract_netlist(old, old.pin_points)
+    b = extract_netlist(new, new.pin_points)
+    for name in sorted(a.keys() | b.keys(), key=natural_key):
+        pa, pb = set(a.get(name, ())), set(b.get(name, ()))
+        if pa == pb:
+            continue
+        if not pb:
+            yield f"- net {name} ({len(pa)} pins)"
+        elif not pa:
+            yield f"+ net {name} ({len(pb)} pins)"
+        else:
+            def pins(ps):
+                return " ".join(f"{r}.{p}" for r, p in sorted(ps, key=lambda rp: (
+                    natural_key(rp[0]), natural_key(rp[1]))))
+            parts = []
+            if pa - pb:
+                parts.append(f"-[{pins(pa - pb)}]")
+            if pb - pa:
+                parts.append(f"+[{pins(pb - pa)}]")
+            yield f"~ net {name}: " + " ".join(parts)
+
+
+def diff_schematics(old_path, new_path, nets=True):
+    """Yield the report lines for the files at `old_path` and `new_path`:
+    components, then positional items, then (with `nets`) nets."""
+    old, new = read_schematic(old_path), read_schematic(new_path)
+    yield from diff_components(old, new)
+    yield from diff_items(old, new)
+    if nets:
+        yield from diff_nets(old, new)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m schgen.diff",
+        description="Compare two schematics by components, items and nets.")
+    parser.add_argument("old")
+    parser.add_argument("new")
+    parser.add_argument("--no-nets", action="store_true", help="skip the net comparison")
+    args = parser.parse_args(argv)
+    status = 0
+    for line in diff_schematics(args.old, args.new, nets=not args.no_nets):
+        print(line)
+        status = 1
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
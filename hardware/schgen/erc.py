@@ -0,0 +1,158 @@
+"""
+Electrical rules check over a SchematicBuilder, before KiCad ever sees it.
+
+Connection points are exact integer-nanometre positions, so every "does
+anything else touch this point" question is one dict lookup;
+points that may sit inside a wire are looked up in a WireIndex on the
+1.27 mm grid.  The whole pass is linear in the number of items.
+
+Rules:
+  duplicate-ref       two components share a reference
+  zero-length-wire    a wire starts and ends on the same point
+  dangling-wire       a wire end touches no pin, label, junction or wire
+  missing-junction    three or more connections meet at a point without a
+                      junction: wire ends, pins and labels, and a wire
+                      passing through counting twice (a T-join)
+  single-label        a global label name is used once (and is no power net)
+  unconnected-pin     a pin touches nothing and has no no-connect flag
+
+Run: python -m schgen.erc [board ...]    (from hardware/)
+"""
+
+import sys
+
+from .items import Symbol, Power, Label, Wire, Junction, NoConnect
+from .netlist import WireIndex, symbol_pin_points
+from .units import mm, to_nm
+
+CELL = to_nm(1.27)  # wire index cell size, nm
+
+
+class Violation:
+    __slots__ = ("rule", "message", "x", "y")
+
+    def __init__(self, rule, message, x, y):
+        self.rule = rule
+        self.message = message
+        self.x = x
+        self.y = y
+
+    def __str__(self):
+        return f"{self.rule}: {self.message} at ({mm(self.x)}, {mm(self.y)})"
+
+
+def check(sb):
+    """Return the Violations in `sb`, grouped by rule and sorted by position."""
+    found = []
+
+    pins = {}         # (x, y) -> number of pins there
+    pin_list = []     # ((x, y), symbol, pin number or None, x, y)
+    wire_ends = {}    # (x, y) -> number of wire ends there
+    end_list = []     # ((x, y), x, y) of each end of a non-empty wire
+    wires = []
+    label_points = {}   # (x, y) -> number of labels there
+    junctions = set()
+    no_connects = set()
+    label_uses = {}   # name -> [Label, ...]
+    power_names = set()
+    refs = {}
+
+    for item in sb.items:
+        if isinstance(item, Wire):
+            a = (item.x1, item.y1)
+            b = (item.x2, item.y2)
+            if a == b:
+                found.append(Violation("zero-length-wire", "wire has zero length",
+                                       item.x1, item.y1))
+                continue
+            wires.append(a + b)
+            for g, x, y in ((a, item.x1, item.y1), (b, item.x2, item.y2)):
+                wire_ends[g] = wire_ends.get(g, 0) + 1
+                end_list.append((g, x, y))
+        elif isinstance(item, Power):
+            g = (item.x, item.y)
+            if item.value != "PWR_FLAG":
+                power_names.add(item.value)
+            pins[g] = pins.get(g, 0) + 1
+            pin_list.append((g, item, None, item.x, item.y))
+        elif isinstance(item, Symbol):
+            refs.setdefault(item.ref, []).append(item)
+            for num, x, y in symbol_pin_points(item):
+                g = (x, y)
+                pins[g] = pins.get(g, 0) + 1
+                pin_list.append((g, item, num, x, y))
+        elif isinstance(item, Label):
+            g = (item.x, item.y)
+            label_points[g] = label_points.get(g, 0) + 1
+            label_uses.setdefault(item.name, []).append(item)
+        elif isinstance(item, Junction):
+            junctions.add((item.x, item.y))
+        elif isinstance(item, NoConnect):
+            no_connects.add((item.x, item.y))
+
+    index = WireIndex(wires, CELL)
+
+    def inside_wire(g):
+        """Number of wires `g` lies on other than at one of their ends."""
+        return sum(1 for x1, y1, x2, y2 in index.wires_at(*g)
+                   if g != (x1, y1) and g != (x2, y2))
+
+    for ref, syms in refs.items():
+        if len(syms) > 1:
+            for sym in syms:
+                found.append(Violation("duplicate-ref",
+                                       f"{ref} is used by {len(syms)} components",
+                                       sym.x, sym.y))
+
+    for g, x, y in end_list:
+        if (wire_ends[g] == 1 and g not in pins and g not in label_points
+                and g not in junctions and g not in no_connects and not inside_wire(g)):
+            found.append(Violation("dangling-wire", "wire end is not connected", x, y))
+
+    # Each point something connects at, once.  A wire passing through is
+    # two connections; points without any wire need no junction.
+    for g in wire_ends.keys() | pins.keys() | label_points.keys():
+        if g in junctions:
+            continue
+        through = inside_wire(g)
+        if not through and g not in wire_ends:
+            continue
+        n = (wire_ends.get(g, 0) + pins.get(g, 0) + label_points.get(g, 0) + 2 * through)
+        if n >= 3:
+            found.append(Violation("missing-junction",
+                                   f"{n} connections meet without a junction", *g))
+
+    for name, labels in label_uses.items():
+        if len(labels) == 1 and name not in power_names:
+            found.append(Violation("single-label", f"global label {name} is used only once",
+                                   labels[0].x, labels[0].y))
+
+    for g, sym, num, x, y in pin_list:
+        if (pins[g] == 1 and g not in wire_ends and g not in no_connects
+                and g not in label_points
+                and not inside_wire(g)):
+            what = f"{sym.value} power symbol" if num is None else f"pin {sym.ref}.{num}"
+            found.append(Violation("unconnected-pin", f"{what} is not connected", x, y))
+
+    rules = {rule: i for i, rule in enumerate(
+        ("duplicate-ref", "zero-length-wire", "dangling-wire", "missing-junction",
+         "single-label", "unconnected-pin"))}
+    found.sort(key=lambda v: (rules[v.rule], v.y, v.x))
+    return found
+
+
+def main(argv=None):
+    from .cli import find_boards, load_board
+    boards = (sys.argv[1:] if argv is None else argv) or find_boards()
+    total = 0
+    for name in boards:
+        violations = check(load_board(name).build_schematic())
+        print(f"# {name}: {len(violations)} violation(s)")
+        for v in violations:
+            print(v)
+        total += len(violations)
+    return 1 if total else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
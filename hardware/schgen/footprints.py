@@ -0,0 +1,232 @@
+"""
+Footprint library loader: .pretty directories of .kicad_mod files parsed
+into compact pad and outline records.
+
+Files are parsed in a process pool and the records cached in one pickle
+keyed by each file's SHA-256, so the duplicated library copies under r1 and
+r2 share entries.  A file whose size and mtime match the cache is not even
+re-hashed, which makes a warm reload a few milliseconds.
+
+Coordinates are integer nanometres (see units.py).
+
+Run: python -m schgen.footprints [board ...] [-j N]    (from hardware/)
+"""
+
+import argparse
+import glob
+import hashlib
+import os
+import sys
+import time
+
+from .cache import read_pickle, write_pickle
+from .cli import HARDWARE_DIR, find_boards, load_board
+from .fpcache import FP_INFO_CACHE, load_index
+from .library import lib_sym_pins
+from .netlist import natural_key
+from .parser import load
+from .sections import CACHE_DIRNAME
+from .units import to_nm
+
+CACHE_NAME = "footprints.pickle"
+_OUTLINES = ("fp_line", "fp_rect", "fp_circle", "fp_arc", "fp_poly")
+
+
+class Pad:
+    """One pad: number ("" for mechanical pads), type (smd, thru_hole, ...),
+    shape, centre and size."""
+    __slots__ = ("number", "kind", "shape", "x", "y", "w", "h")
+
+    def __init__(self, number, kind, shape, x, y, w, h):
+        self.number = number
+        self.kind = kind
+        self.shape = shape
+        self.x = x
+        self.y = y
+        self.w = w
+        self.h = h
+
+
+class Footprint:
+    """Pads and outlines of one .kicad_mod.  Outlines are (kind, layer,
+    points) with points a tuple of (x, y)."""
+    __slots__ = ("name", "pads", "outlines")
+
+    def __init__(self, name, pads, outlines):
+        self.name = name
+        self.pads = pads
+        self.outlines = outlines
+
+    def __repr__(self):
+        return f"Footprint({self.name!r}, {len(self.pads)} pads)"
+
+    @property
+    def pad_names(self):
+        """Distinct electrical pad numbers, in natural order."""
+        return sorted({p.number for p in self.pads if p.number}, key=natural_key)
+
+    @property
+    def pad_count(self):
+        return len(self.pad_names)
+
+
+def _point(node):
+    return to_nm(float(node.items[1])), to_nm(float(node.items[2]))
+
+
+def parse_footprint(path):
+    """Parse the .kicad_mod at `path` into a Footprint."""
+    root = load(path)
+    fp = root.get("footprint") or root.get("module")  # KiCad 5 used "module"
+    if fp is None:
+        raise ValueError(f"{path}: not a footprint")
+    pads = []
+    outlines = []
+    for node in fp.lists():
+        head = node.head
+        if head == "pad":
+            at, size = node.get("at"), node.get("size")
+            x, y = _point(at) if at else (0, 0)
+            w, h = _point(size) if size else (0, 0)
+            pads.append(Pad(node.value(1), node.items[2], node.items[3], x, y, w, h))
+        elif head in _OUTLINES:
+            layer = node.get("layer")
+            pts = node.get("pts")
+            if pts is not None:
+                points = tuple(_point(p) for p in pts.lists("xy"))
+            else:
+                points = tuple(_point(p) for p in node.lists()
+                               if p.head in ("start", "mid", "end", "center"))
+            outlines.append((head, layer.value() if layer else "", points))
+    return Footprint(fp.value(1), tuple(pads), tuple(outlines))
+
+
+def _file_digest(path):
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            h.update(block)
+    return h.hexdigest()
+
+
+def _parse_file(path):
+    """Process-pool worker."""
+    return _file_digest(path), parse_footprint(path)
+
+
+def load_library(pretty_dir, jobs=1, cache_dir=None):
+    """{footprint name: Footprint} for the .pretty directory `pretty_dir`.
+
+    Files missing from the cache in `cache_dir` (default: the one under
+    hardware/) are parsed, with `jobs` > 1 in a process pool, and added to it.
+    """
+    cache_dir = cache_dir or os.path.join(HARDWARE_DIR, CACHE_DIRNAME)
+    cache_path = os.path.join(cache_dir, CACHE_NAME)
+    # path -> (mtime_ns, size, digest); digest -> Footprint
+    stamps, records = read_pickle(cache_path) or ({}, {})
+
+    library = {}
+    todo = []
+    for path in sorted(glob.glob(os.path.join(glob.escape(pretty_dir), "*.kicad_mod"))):
+        name = os.path.splitext(os.path.basename(path))[0]
+        st = os.stat(path)
+        stamp = stamps.get(path)
+        if stamp is not None and stamp[:2] == (st.st_mtime_ns, st.st_size):
+            library[name] = records[stamp[2]]
+        else:
+            todo.append((name, path, st))
+    if not todo:
+        return library
+
+    # Touched but unchanged files only need hashing
+    parse = []
+    for name, path, st in todo:
+        digest = _file_digest(path)
+        if digest in records:
+            library[name] = records[digest]
+            stamps[path] = (st.st_mtime_ns, st.st_size, digest)
+        else:
+            parse.append((name, path, st))
+    if jobs > 1 and len(parse) > 1:
+        from concurrent.futures import ProcessPoolExecutor
+        with ProcessPoolExecutor(max_workers=min(jobs, len(parse))) as pool:
+            parsed = list(pool.map(_parse_file, [path for _, path, _ in parse], chunksize=4))
+    else:
+        parsed = [_parse_file(path) for _, path, _ in parse]
+    for (name, path, st), (digest, footprint) in zip(parse, parsed):
+        library[name] = records[digest] = footprint
+        stamps[path] = (st.st_mtime_ns, st.st_size, digest)
+
+    write_pickle(cache_path, (stamps, records))
+    return library
+
+
+def board_libraries(board_dir, jobs=1, cache_dir=None):
+    """{nickname: library} for every .pretty under the board's "library copies"."""
+    libs = {}
+    pattern = os.path.join(glob.escape(os.path.join(board_dir, "library copies")), "*.pretty")
+    for pretty in sorted(glob.glob(pattern)):
+        nickname = os.path.splitext(os.path.basename(pretty))[0]
+        libs[nickname] = load_library(pretty, jobs, cache_dir)
+    return libs
+
+
+def pad_mismatches(sb, libraries, index=None):
+    """(ref, footprint, problem) for every component whose footprint pads do
+    not match its symbol's pins.  Footprints in `libraries` are compared pad
+    number by pin number; others listed in FootprintIndex `index` (the
+    board's fp-info-cache) only by unique pad count."""
+    found = []
+    for ref in sorted(sb.symbols, key=natural_key):
+        sym = sb.symbols[ref]
+        if not sym.footprint:
+            continue
+        pins = set(lib_sym_pins(sym.lib_id))
+        nickname, _, name = sym.footprint.partition(":")
+        footprint = libraries.get(nickname, {}).get(name)
+        if footprint is not None:
+            pads = set(footprint.pad_names)
+            if pins != pads:
+                found.append((ref, sym.footprint,
+                              f"pins without pad {sorted(pins - pads, key=natural_key)}, "
+                              f"pads without pin {sorted(pads - pins, key=natural_key)}"))
+            continue
+        info = index.get(sym.footprint) if index is not None else None
+        if info is not None and info.unique_pads != len(pins):
+            found.append((ref, sym.footprint,
+                          f"{len(pins)} pins, {info.unique_pads} pads"))
+    return found
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m schgen.footprints",
+        description="Load each board's footprint library copies and check "
+                    "footprint pads against symbol pins.")
+    parser.add_argument("boards", nargs="*", help="board directories (default: all)")
+    parser.add_argument("-j", "--jobs", type=int, default=os.cpu_count() or 1,
+                        help="parse in a pool of JOBS processes (default: CPUs)")
+    args = parser.parse_args(argv)
+    status = 0
+    for name in args.boards or find_boards():
+        t0 = time.perf_counter()
+        board_dir = os.path.join(HARDWARE_DIR, name)
+        libs = board_libraries(board_dir, args.jobs)
+        dt = time.perf_counter() - t0
+        count = sum(len(lib) for lib in libs.values())
+        fp_info = os.path.join(board_dir, FP_INFO_CACHE)
+        index = load_index(fp_info) if os.path.exists(fp_info) else None
+        mismatches = pad_mismatches(load_board(name).build_schematic(), libs, index)
+        print(f"# {name}: {count} footprints in {', '.join(libs) or 'no libraries'} "
+              f"({dt * 1e3:.1f} ms), {len(mismatches)} pad/pin mismatch(es)")
+        for ref, footprint, problem in mismatches:
+            print(f"{ref} {footprint!r}: {problem}")
+        status = status or bool(mismatches)
+    return int(status)
+
+
+if __name__ == "__main__":
+    # Run through the package module so cached records pickle as
+    # schgen.footprints.Footprint rather than __main__.Footprint
+    from schgen.footprints import main
+    sys.exit(main())
@@ -0,0 +1,109 @@
+"""
+Footprint lookups in a board's fp-info-cache.
+
+fp-info-cache is KiCad's list of every footprint in the project's
+libraries: a timestamp line, then seven lines per footprint (library, name,
+description, keywords, attributes, pad count, unique pad count).
+FootprintIndex scans it once into a "library:name" -> byte offset index and
+pickles that next to the section cache; later runs reuse it until the
+file's mtime or size changes.  Membership is then a dict lookup, and an
+entry's details are read from its offset on demand.
+"""
+
+import os
+
+from .cache import cached, file_stamp
+from .sections import CACHE_DIRNAME
+
+FP_INFO_CACHE = "fp-info-cache"
+_INDEX_NAME = "fp-info-cache.index"
+_FIELDS = 7  # lines per footprint entry
+
+
+class FootprintInfo:
+    """One fp-info-cache entry."""
+    __slots__ = ("library", "name", "description", "keywords", "pads", "unique_pads")
+
+    def __init__(self, library, name, description, keywords, pads, unique_pads):
+        self.library = library
+        self.name = name
+        self.description = description
+        self.keywords = keywords
+        self.pads = pads
+        self.unique_pads = unique_pads
+
+    def __repr__(self):
+        return f"FootprintInfo({self.library}:{self.name}, {self.pads} pads)"
+
+
+class FootprintIndex:
+    """Offset index of one fp-info-cache file."""
+    __slots__ = ("path", "offsets")
+
+    def __init__(self, path, offsets):
+        self.path = path
+        self.offsets = offsets  # "library:name" -> byte offset of the entry
+
+    def __contains__(self, footprint):
+        return footprint in self.offsets
+
+    def __len__(self):
+        return len(self.offsets)
+
+    def get(self, footprint):
+        """FootprintInfo for "library:name", or None if it is not listed."""
+        offset = self.offsets.get(footprint)
+        if offset is None:
+            return None
+        with open(self.path, "rb") as f:
+            f.seek(offset)
+            lines = [f.readline().rstrip(b"\r\n").decode("utf-8") for _ in range(_FIELDS)]
+        library, name, description, keywords, _attrs, pads, unique_pads = lines
+        return FootprintInfo(library, name, description, keywords,
+                             int(pads), int(unique_pads))
+
+
+def scan(path):
+    """{"library:name": byte offset} of every entry in fp-info-cache `path`."""
+    with open(path, "rb") as f:
+        data = f.read()
+    pos = data.find(b"\n") + 1  # skip the timestamp line
+    lines = data[pos:].split(b"\n")
+    offsets = {}
+    for i in range(0, len(lines) - _FIELDS + 1, _FIELDS):
+        entry = lines[i:i + _FIELDS]
+        key = entry[0].rstrip(b"\r") + b":" + entry[1].rstrip(b"\r")
+        offsets[key.decode("utf-8")] = pos
+        pos += sum(map(len, entry)) + _FIELDS
+    return offsets
+
+
+def load_index(path, index_dir=None, use_cache=True):
+    """FootprintIndex of fp-info-cache `path`.  The index is kept in
+    `index_dir` (default: the section cache next to `path`) and rebuilt
+    when the file's mtime or size no longer matches; without `use_cache`
+    it is scanned afresh and not stored."""
+    if index_dir is None:
+        index_dir = os.path.join(os.path.dirname(path), CACHE_DIRNAME)
+    index_path = os.path.join(index_dir, _INDEX_NAME) if use_cache else None
+    return FootprintIndex(path, cached(index_path, file_stamp(path), lambda: scan(path)))
+
+
+def unknown_footprints(sb, index):
+    """(ref, footprint) of every component whose footprint is set but not in
+    `index`, in reference order."""
+    return sorted((sym.ref, sym.footprint) for sym in sb.symbols.values()
+                  if sym.footprint and sym.footprint not in index)
+
+
+def check_footprints(sb, board_dir, use_cache=True):
+    """Raise ValueError if `sb` uses a footprint missing from the board's
+    fp-info-cache.  Boards without one are not checked.  `use_cache` is
+    passed on to load_index()."""
+    path = os.path.join(board_dir, FP_INFO_CACHE)
+    if not os.path.exists(path):
+        return
+    unknown = unknown_footprints(sb, load_index(path, use_cache=use_cache))
+    if unknown:
+        raise ValueError(f"footprint(s) not in {path}: "
+                         + ", ".join(f"{ref} {fp!r}" for ref, fp in unknown))
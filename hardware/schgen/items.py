@@ -0,0 +1,202 @@
+"""Schematic item records, rendered lazily at write time.
+
+Coordinates are integer nanometres (see units.py).
+"""
+
+from .sexpr import xy, at, effects
+from .units import mm, to_nm
+
+PROPERTY_OFFSET = to_nm(2.54)  # Reference/Value text offset from the symbol
+
+
+class Symbol:
+    """Component instance."""
+    __slots__ = ("lib_id", "ref", "value", "x", "y", "rot", "footprint",
+                 "mirror", "extra_props", "pins", "uuid")
+
+    def __init__(self, lib_id, ref, value, x, y, rot, footprint, mirror,
+                 extra_props, pins, uid):
+        self.lib_id = lib_id
+        self.ref = ref
+        self.value = value
+        self.x = x
+        self.y = y
+        self.rot = rot
+        self.footprint = footprint
+        self.mirror = mirror
+        self.extra_props = extra_props
+        self.pins = pins  # ((pin_num, uuid), ...)
+        self.uuid = uid
+
+    def render(self):
+        x, y = self.x, self.y
+        mir = " (mirror x)" if self.mirror else ""
+        lines = []
+        lines.append(f'  (symbol (lib_id "{self.lib_id}") {at(x, y, self.rot)}{mir} (unit 1)')
+        lines.append(f'    (in_bom yes) (on_board yes) (dnp no)')
+        lines.append(f'    (uuid "{self.uuid}")')
+        # Properties
+        rx, ry = x + PROPERTY_OFFSET, y
+        lines.append(f'    (property "Reference" "{self.ref}" {at(rx, ry)} {effects()})')
+        lines.append(f'    (property "Value" "{self.value}" {at(rx, ry - PROPERTY_OFFSET)} {effects()})')
+        lines.append(f'    (property "Footprint" "{self.footprint}" {at(x, y)} {effects(hide=True)})')
+        lines.append(f'    (property "Datasheet" "~" {at(x, y)} {effects(hide=True)})')
+        if self.extra_props:
+            for pn, pv in self.extra_props.items():
+                lines.append(f'    (property "{pn}" "{pv}" {at(x, y)} {effects(hide=True)})')
+        for pin_num, puid in self.pins:
+            lines.append(f'    (pin "{pin_num}" (uuid "{puid}"))')
+        lines.append(f'  )')
+        return "\n".join(lines)
+
+
+class Power(Symbol):
+    """Power symbol instance (GND, +12V, +5V, +3V3, PWR_FLAG)."""
+    __slots__ = ()
+
+    def render(self):
+        x, y = self.x, self.y
+        lines = []
+        lines.append(f'  (symbol (lib_id "{self.lib_id}") {at(x, y, self.rot)} (unit 1)')
+        lines.append(f'    (in_bom yes) (on_board yes) (dnp no)')
+        lines.append(f'    (uuid "{self.uuid}")')
+        lines.append(f'    (property "Reference" "{self.ref}" {at(x, y)} {effects(hide=True)})')
+        lines.append(f'    (property "Value" "{self.value}" {at(x, y + PROPERTY_OFFSET)} {effects()})')
+        lines.append(f'    (property "Footprint" "" {at(x, y)} {effects(hide=True)})')
+        lines.append(f'    (property "Datasheet" "" {at(x, y)} {effects(hide=True)})')
+        for pin_num, puid in self.pins:
+            lines.append(f'    (pin "{pin_num}" (uuid "{puid}"))')
+        lines.append(f'  )')
+        return "\n".join(lines)
+
+
+class Label:
+    """Global label, or a local label (read from a file) if `shape` is None."""
+    __slots__ = ("name", "x", "y", "rot", "shape", "uuid")
+
+    def __init__(self, name, x, y, rot, shape, uid):
+        self.name = name
+        self.x = x
+        self.y = y
+        self.rot = rot
+        self.shape = shape
+        self.uuid = uid
+
+    def render(self):
+        if self.shape is None:
+            justify = "right" if self.rot in (180, 270) else "left"
+            return (
+                f'  (label "{self.name}" {at(self.x, self.y, self.rot)}\n'
+                f'    (effects (font (size 1.27 1.27)) (justify {justify} bottom))\n'
+                f'    (uuid "{self.uuid}")\n'
+                f'  )'
+            )
+        return (
+            f'  (global_label "{self.name}" (shape {self.shape}) {at(self.x, self.y, self.rot)}\n'
+            f'    (effects (font (size 1.27 1.27)))\n'
+            f'    (uuid "{self.uuid}")\n'
+            f'    (property "Intersheets" "" {at(self.x, self.y)} {effects(hide=True)})\n'
+            f'  )'
+        )
+
+
+class Wire:
+    """Wire segment."""
+    __slots__ = ("x1", "y1", "x2", "y2", "uuid")
+
+    def __init__(self, x1, y1, x2, y2, uid):
+        self.x1 = x1
+        self.y1 = y1
+        self.x2 = x2
+        self.y2 = y2
+        self.uuid = uid
+
+    def render(self):
+        return (
+            f'  (wire (pts {xy(self.x1, self.y1)} {xy(self.x2, self.y2)})\n'
+            f'    (stroke (width 0) (type default))\n'
+            f'    (uuid "{self.uuid}")\n'
+            f'  )'
+        )
+
+
+class Junction:
+    __slots__ = ("x", "y", "uuid")
+
+    def __init__(self, x, y, uid):
+        self.x = x
+        self.y = y
+        self.uuid = uid
+
+    def render(self):
+        return (
+            f'  (junction (at {mm(self.x)} {mm(self.y)}) (diameter 0) (color 0 0 0 0)\n'
+            f'    (uuid "{self.uuid}")\n'
+            f'  )'
+        )
+
+
+class NoConnect:
+    __slots__ = ("x", "y", "uuid")
+
+    def __init__(self, x, y, uid):
+        self.x = x
+        self.y = y
+        self.uuid = uid
+
+    def render(self):
+        return f'  (no_connect (at {mm(self.x)} {mm(self.y)}) (uuid "{self.uuid}"))'
+
+
+class Text:
+    __slots__ = ("text", "x", "y", "size", "uuid")
+
+    def __init__(self, text, x, y, size, uid):
+        self.text = text
+        self.x = x
+        self.y = y
+        self.size = size
+        self.uuid = uid
+
+    def render(self):
+        return (
+            f'  (text "{self.text}" {at(self.x, self.y)}\n'
+            f'    (effects (font (size {self.size} {self.size}) bold))\n'
+            f'    (uuid "{self.uuid}")\n'
+            f'  )'
+        )
+
+
+class Rect:
+    """Dashed rectangle (section border)."""
+    __slots__ = ("x", "y", "w", "h", "uuid")
+
+    def __init__(self, x, y, w, h, uid):
+        self.x = x
+        self.y = y
+        self.w = w
+        self.h = h
+        self.uuid = uid
+
+    def render(self):
+        x, y = self.x, self.y
+        return (
+            f'  (rectangle (start {mm(x)} {mm(y)}) (end {mm(x + self.w)} {mm(y + self.h)})\n'
+            f'    (stroke (width 0.254) (type dash))\n'
+            f'    (fill (type none))\n'
+            f'    (uuid "{self.uuid}")\n'
+            f'  )'
+        )
+
+
+class RawItem:
+    """Item read from a file that has no record of its own (text, graphics,
+    the title block, ...), kept as its S-expression text."""
+    __slots__ = ("text", "uuid")
+
+    def __init__(self, text, uid):
+        self.text = text
+        self.uuid = uid
+
+    def render(self):
+        return f'  {self.text}'
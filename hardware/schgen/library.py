@@ -0,0 +1,530 @@
+"""
+Library symbol definitions embedded in the schematic's lib_symbols block.
+
+Each definition is rendered once per process by lib_sym_for() and shared by
+every builder, so batch runs over several boards pay for it only once.
+"""
+
+import os
+import re
+import textwrap
+
+from .units import to_nm
+
+# ---------------------------------------------------------------------------
+# Library symbol definitions
+# ---------------------------------------------------------------------------
+def lib_sym_resistor():
+    return textwrap.dedent("""\
+    (symbol "Device:R"
+      (pin_numbers hide) (pin_names (offset 0) hide)
+      (exclude_from_sim no) (in_bom yes) (on_board yes)
+      (property "Reference" "R" (at 2.032 0 90) (effects (font (size 1.27 1.27))))
+      (property "Value" "R" (at -2.032 0 90) (effects (font (size 1.27 1.27))))
+      (property "Footprint" "" (at -1.778 0 90) (effects (font (size 1.27 1.27)) hide))
+      (property "Datasheet" "~" (at 0 0 0) (effects (font (size 1.27 1.27)) hide))
+      (symbol "R_0_1"
+        (rectangle (start -1.016 -2.54) (end 1.016 2.54)
+          (stroke (width 0) (type default)) (fill (type none))))
+      (symbol "R_1_1"
+        (pin passive line (at 0 3.81 270) (length 1.27)
+          (name "~" (effects (font (size 1.27 1.27))))
+          (number "1" (effects (font (size 1.27 1.27)))))
+        (pin passive line (at 0 -3.81 90) (length 1.27)
+          (name "~" (effects (font (size 1.27 1.27))))
+          (number "2" (effects (font (size 1.27 1.27))))))
+    )""")
+
+def lib_sym_capacitor():
+    return textwrap.dedent("""\
+    (symbol "Device:C"
+      (pin_numbers hide) (pin_names (offset 0.254) hide)
+      (exclude_from_sim no) (in_bom yes) (on_board yes)
+      (property "Reference" "C" (at 1.524 0 90) (effects (font (size 1.27 1.27))))
+      (property "Value" "C" (at -1.524 0 90) (effects (font (size 1.27 1.27))))
+      (property "Footprint" "" (at 0.9652 -2.54 0) (effects (font (size 1.27 1.27)) hide))
+      (property "Datasheet" "~" (at 0 0 0) (effects (font (size 1.27 1.27)) hide))
+      (symbol "C_0_1"
+        (polyline (pts (xy -1.524 -0.508) (xy 1.524 -0.508))
+          (stroke (width 0.3048) (type default)) (fill (type none)))
+        (polyline (pts (xy -1.524 0.508) (xy 1.524 0.508))
+          (stroke (width 0.3048) (type default)) (fill (type none))))
+      (symbol "C_1_1"
+        (pin passive line (at 0 2.54 270) (length 2.032)
+          (name "~" (effects (font (size 1.27 1.27))))
+          (number "1" (effects (font (size 1.27 1.27)))))
+        (pin passive line (at 0 -2.54 90) (length 2.032)
+          (name "~" (effects (font (size 1.27 1.27))))
+          (number "2" (effects (font (size 1.27 1.27))))))
+    )""")
+
+def lib_sym_capacitor_polar():
+    return textwrap.dedent("""\
+    (symbol "Device:CP"
+      (pin_numbers hide) (pin_names (offset 0.254) hide)
+      (exclude_from_sim no) (in_bom yes) (on_board yes)
+      (property "Reference" "C" (at 1.524 0 90) (effects (font (size 1.27 1.27))))
+      (property "Value" "CP" (at -1.524 0 90) (effects (font (size 1.27 1.27))))
+      (property "Footprint" "" (at 0 0 0) (effects (font (size 1.27 1.27)) hide))
+      (property "Datasheet" "~" (at 0 0 0) (effects (font (size 1.27 1.27)) hide))
+      (symbol "CP_0_1"
+        (polyline (pts (xy -1.524 -0.508) (xy 1.524 -0.508))
+          (stroke (width 0.3048) (type default)) (fill (type none)))
+        (polyline (pts (xy -1.524 0.508) (xy 1.524 0.508))
+          (stroke (width 0.3048) (type default)) (fill (type none)))
+        (polyline (pts (xy -0.508 1.27) (xy 0.508 1.27))
+          (stroke (width 0.254) (type default)) (fill (type none)))
+        (polyline (pts (xy 0 0.762) (xy 0 1.778))
+          (stroke (width 0.254) (type default)) (fill (type none))))
+      (symbol "CP_1_1"
+        (pin passive line (at 0 2.54 270) (length 2.032)
+          (name "~" (effects (font (size 1.27 1.27))))
+          (number "1" (effects (font (size 1.27 1.27)))))
+        (pin passive line (at 0 -2.54 90) (length 2.032)
+          (name "~" (effects (font (size 1.27 1.27))))
+          (number "2" (effects (font (size 1.27 1.27))))))
+    )""")
+
+def lib_sym_diode_schottky():
+    return textwrap.dedent("""\
+    (symbol "Device:D_Schottky"
+      (pin_numbers hide) (pin_names (offset 1.016) hide)
+      (exclude_from_sim no) (in_bom yes) (on_board yes)
+      (property "Reference" "D" (at 0 2.54 0) (effects (font (size 1.27 1.27))))
+      (property "Value" "D_Schottky" (at 0 -2.54 0) (effects (font (size 1.27 1.27))))
+      (property "Footprint" "" (at 0 0 0) (effects (font (size 1.27 1.27)) hide))
+      (property "Datasheet" "~" (at 0 0 0) (effects (font (size 1.27 1.27)) hide))
+      (symbol "D_Schottky_0_1"
+        (polyline (pts (xy -1.27 1.27) (xy -1.27 -1.27) (xy 1.27 0) (xy -1.27 1.27))
+          (stroke (width 0.254) (type default)) (fill (type none)))
+        (polyline (pts (xy 1.27 1.27) (xy 1.27 -1.27))
+          (stroke (width 0.254) (type default)) (fill (type none))))
+      (symbol "D_Schottky_1_1"
+        (pin passive line (at -3.81 0 0) (length 2.54)
+          (name "K" (effects (font (size 1.27 1.27))))
+          (number "1" (effects (font (size 1.27 1.27)))))
+        (pin passive line (at 3.81 0 180) (length 2.54)
+          (name "A" (effects (font (size 1.27 1.27))))
+          (number "2" (effects (font (size 1.27 1.27))))))
+    )""")
+
+def lib_sym_diode_tvs():
+    return textwrap.dedent("""\
+    (symbol "Device:D_TVS"
+      (pin_numbers hide) (pin_names (offset 1.016) hide)
+      (exclude_from_sim no) (in_bom yes) (on_board yes)
+      (property "Reference" "D" (at 0 2.54 0) (effects (font (size 1.27 1.27))))
+      (property "Value" "D_TVS" (at 0 -2.54 0) (effects (font (size 1.27 1.27))))
+      (property "Footprint" "" (at 0 0 0) (effects (font (size 1.27 1.27)) hide))
+      (property "Datasheet" "~" (at 0 0 0) (effects (font (size 1.27 1.27)) hide))
+      (symbol "D_TVS_0_1"
+        (polyline (pts (xy -1.27 1.27) (xy -1.27 -1.27) (xy 1.27 0) (xy -1.27 1.27))
+          (stroke (width 0.254) (type default)) (fill (type none)))
+        (polyline (pts (xy 1.27 1.27) (xy 1.27 -1.27))
+          (stroke (width 0.254) (type default)) (fill (type none))))
+      (symbol "D_TVS_1_1"
+        (pin passive line (at -3.81 0 0) (length 2.54)
+          (name "A1" (effects (font (size 1.27 1.27))))
+          (number "1" (effects (font (size 1.27 1.27)))))
+        (pin passive line (at 3.81 0 180) (length 2.54)
+          (name "A2" (effects (font (size 1.27 1.27))))
+          (number "2" (effects (font (size 1.27 1.27))))))
+    )""")
+
+def lib_sym_fuse():
+    return textwrap.dedent("""\
+    (symbol "Device:Fuse"
+      (pin_numbers hide) (pin_names (offset 0) hide)
+      (exclude_from_sim no) (in_bom yes) (on_board yes)
+      (property "Reference" "F" (at 2.032 0 90) (effects (font (size 1.27 1.27))))
+      (property "Value" "Fuse" (at -2.032 0 90) (effects (font (size 1.27 1.27))))
+      (property "Footprint" "" (at 0 0 0) (effects (font (size 1.27 1.27)) hide))
+      (property "Datasheet" "~" (at 0 0 0) (effects (font (size 1.27 1.27)) hide))
+      (symbol "Fuse_0_1"
+        (rectangle (start -0.762 -2.54) (end 0.762 2.54)
+          (stroke (width 0.254) (type default)) (fill (type none)))
+        (polyline (pts (xy 0 2.54) (xy 0 -2.54))
+          (stroke (width 0) (type default)) (fill (type none))))
+      (symbol "Fuse_1_1"
+        (pin passive line (at 0 3.81 270) (length 1.27)
+          (name "~" (effects (font (size 1.27 1.27))))
+          (number "1" (effects (font (size 1.27 1.27)))))
+        (pin passive line (at 0 -3.81 90) (length 1.27)
+          (name "~" (effects (font (size 1.27 1.27))))
+          (number "2" (effects (font (size 1.27 1.27))))))
+    )""")
+
+def lib_sym_nmos():
+    """N-channel MOSFET: pin 1=G, pin 2=D, pin 3=S"""
+    return textwrap.dedent("""\
+    (symbol "Device:Q_NMOS_GDS"
+      (pin_names (offset 0) hide)
+      (exclude_from_sim no) (in_bom yes) (on_board yes)
+      (property "Reference" "Q" (at 5.08 1.905 0) (effects (font (size 1.27 1.27)) (justify left)))
+      (property "Value" "Q_NMOS_GDS" (at 5.08 0 0) (effects (font (size 1.27 1.27)) (justify left)))
+      (property "Footprint" "" (at 5.08 -1.905 0) (effects (font (size 1.27 1.27)) hide))
+      (property "Datasheet" "~" (at 0 0 0) (effects (font (size 1.27 1.27)) hide))
+      (symbol "Q_NMOS_GDS_0_1"
+        (polyline (pts (xy 0.254 0) (xy -2.54 0))
+          (stroke (width 0) (type default)) (fill (type none)))
+        (polyline (pts (xy 0.254 1.905) (xy 0.254 -1.905))
+          (stroke (width 0.254) (type default)) (fill (type none)))
+        (polyline (pts (xy 0.762 -1.27) (xy 0.762 -2.286))
+          (stroke (width 0.254) (type default)) (fill (type none)))
+        (polyline (pts (xy 0.762 0.508) (xy 0.762 -0.508))
+          (stroke (width 0.254) (type default)) (fill (type none)))
+        (polyline (pts (xy 0.762 2.286) (xy 0.762 1.27))
+          (stroke (width 0.254) (type default)) (fill (type none)))
+        (polyline (pts (xy 2.54 2.54) (xy 2.54 1.778) (xy 0.762 1.778))
+          (stroke (width 0) (type default)) (fill (type none)))
+        (polyline (pts (xy 2.54 -2.54) (xy 2.54 -1.778) (xy 0.762 -1.778))
+          (stroke (width 0) (type default)) (fill (type none)))
+        (polyline (pts (xy 0.762 -0.508) (xy 2.54 -0.508) (xy 2.54 -1.778))
+          (stroke (width 0) (type default)) (fill (type none)))
+        (polyline (pts (xy 0.762 0.508) (xy 1.524 0.254) (xy 1.524 0.762) (xy 0.762 0.508))
+          (stroke (width 0) (type default)) (fill (type outline)))
+        (circle (center 1.651 0) (radius 2.794)
+          (stroke (width 0.254) (type default)) (fill (type none))))
+      (symbol "Q_NMOS_GDS_1_1"
+        (pin passive line (at -5.08 0 0) (length 2.54)
+          (name "G" (effects (font (size 1.27 1.27))))
+          (number "1" (effects (font (size 1.27 1.27)))))
+        (pin passive line (at 2.54 5.08 270) (length 2.54)
+          (name "D" (effects (font (size 1.27 1.27))))
+          (number "2" (effects (font (size 1.27 1.27)))))
+        (pin passive line (at 2.54 -5.08 90) (length 2.54)
+          (name "S" (effects (font (size 1.27 1.27))))
+          (number "3" (effects (font (size 1.27 1.27))))))
+    )""")
+
+def lib_sym_pmos():
+    """P-channel MOSFET: pin 1=G, pin 2=S, pin 3=D"""
+    return textwrap.dedent("""\
+    (symbol "Device:Q_PMOS_GSD"
+      (pin_names (offset 0) hide)
+      (exclude_from_sim no) (in_bom yes) (on_board yes)
+      (property "Reference" "Q" (at 5.08 1.905 0) (effects (font (size 1.27 1.27)) (justify left)))
+      (property "Value" "Q_PMOS_GSD" (at 5.08 0 0) (effects (font (size 1.27 1.27)) (justify left)))
+      (property "Footprint" "" (at 5.08 -1.905 0) (effects (font (size 1.27 1.27)) hide))
+      (property "Datasheet" "~" (at 0 0 0) (effects (font (size 1.27 1.27)) hide))
+      (symbol "Q_PMOS_GSD_0_1"
+        (polyline (pts (xy 0.254 0) (xy -2.54 0))
+          (stroke (width 0) (type default)) (fill (type none)))
+        (polyline (pts (xy 0.254 1.905) (xy 0.254 -1.905))
+          (stroke (width 0.254) (type default)) (fill (type none)))
+        (polyline (pts (xy 0.762 -1.27) (xy 0.762 -2.286))
+          (stroke (width 0.254) (type default)) (fill (type none)))
+        (polyline (pts (xy 0.762 0.508) (xy 0.762 -0.508))
+          (stroke (width 0.254) (type default)) (fill (type none)))
+        (polyline (pts (xy 0.762 2.286) (xy 0.762 1.27))
+          (stroke (width 0.254) (type default)) (fill (type none)))
+        (polyline (pts (xy 2.54 2.54) (xy 2.54 1.778) (xy 0.762 1.778))
+          (stroke (width 0) (type default)) (fill (type none)))
+        (polyline (pts (xy 2.54 -2.54) (xy 2.54 -1.778) (xy 0.762 -1.778))
+          (stroke (width 0) (type default)) (fill (type none)))
+        (polyline (pts (xy 0.762 0.508) (xy 2.54 0.508) (xy 2.54 1.778))
+          (stroke (width 0) (type default)) (fill (type none)))
+        (polyline (pts (xy 1.524 -0.254) (xy 0.762 0.508) (xy 1.524 0.762))
+          (stroke (width 0) (type default)) (fill (type outline)))
+        (circle (center 1.651 0) (radius 2.794)
+          (stroke (width 0.254) (type default)) (fill (type none))))
+      (symbol "Q_PMOS_GSD_1_1"
+        (pin passive line (at -5.08 0 0) (length 2.54)
+          (name "G" (effects (font (size 1.27 1.27))))
+          (number "1" (effects (font (size 1.27 1.27)))))
+        (pin passive line (at 2.54 -5.08 90) (length 2.54)
+          (name "S" (effects (font (size 1.27 1.27))))
+          (number "2" (effects (font (size 1.27 1.27)))))
+        (pin passive line (at 2.54 5.08 270) (length 2.54)
+          (name "D" (effects (font (size 1.27 1.27))))
+          (number "3" (effects (font (size 1.27 1.27))))))
+    )""")
+
+def lib_sym_ams1117():
+    """AMS1117-3.3 LDO: pin 1=GND/ADJ, pin 2=VOUT, pin 3=VIN"""
+    return textwrap.dedent("""\
+    (symbol "Regulator_Linear:AMS1117-3.3"
+      (pin_names (offset 0.254))
+      (exclude_from_sim no) (in_bom yes) (on_board yes)
+      (property "Reference" "U" (at 0 5.08 0) (effects (font (size 1.27 1.27))))
+      (property "Value" "AMS1117-3.3" (at 0 -5.08 0) (effects (font (size 1.27 1.27))))
+      (property "Footprint" "Package_TO_SOT_SMD:SOT-223-3_TabPin2" (at 0 0 0) (effects (font (size 1.27 1.27)) hide))
+      (property "Datasheet" "http://www.advanced-monolithic.com/pdf/ds1117.pdf" (at 0 0 0) (effects (font (size 1.27 1.27)) hide))
+      (symbol "AMS1117-3.3_0_1"
+        (rectangle (start -5.08 3.81) (end 5.08 -3.81)
+          (stroke (width 0.254) (type default)) (fill (type background))))
+      (symbol "AMS1117-3.3_1_1"
+        (pin power_in line (at 0 -6.35 90) (length 2.54)
+          (name "GND" (effects (font (size 1.27 1.27))))
+          (number "1" (effects (font (size 1.27 1.27)))))
+        (pin power_out line (at 7.62 0 180) (length 2.54)
+          (name "VO" (effects (font (size 1.27 1.27))))
+          (number "2" (effects (font (size 1.27 1.27)))))
+        (pin power_in line (at -7.62 0 0) (length 2.54)
+          (name "VI" (effects (font (size 1.27 1.27))))
+          (number "3" (effects (font (size 1.27 1.27))))))
+    )""")
+
+def lib_sym_conn(n_pins):
+    """Generic N-pin connector symbol."""
+    local_name = f"Conn_01x{n_pins:02d}_Pin"
+    sym_name = f"Connector:{local_name}"
+    lines = []
+    lines.append(f'    (symbol "{sym_name}"')
+    lines.append(f'      (pin_names (offset 1.016))')
+    lines.append(f'      (exclude_from_sim no) (in_bom yes) (on_board yes)')
+    lines.append(f'      (property "Reference" "J" (at 0 {n_pins * 1.27 + 2.54:.2f} 0) (effects (font (size 1.27 1.27))))')
+    lines.append(f'      (property "Value" "Conn_01x{n_pins:02d}" (at 0 {-n_pins * 1.27 - 2.54:.2f} 0) (effects (font (size 1.27 1.27))))')
+    lines.append(f'      (property "Footprint" "" (at 0 0 0) (effects (font (size 1.27 1.27)) hide))')
+    lines.append(f'      (property "Datasheet" "~" (at 0 0 0) (effects (font (size 1.27 1.27)) hide))')
+    # Body
+    half_h = n_pins * 1.27
+    lines.append(f'      (symbol "{local_name}_1_1"')
+    lines.append(f'        (rectangle (start -1.27 {half_h:.2f}) (end 1.27 {-half_h:.2f})')
+    lines.append(f'          (stroke (width 0.254) (type default)) (fill (type background)))')
+    # Pins
+    for i in range(n_pins):
+        py = half_h - 1.27 - i * 2.54
+        lines.append(f'        (pin passive line (at -3.81 {py:.2f} 0) (length 2.54)')
+        lines.append(f'          (name "Pin_{i+1}" (effects (font (size 1.27 1.27))))')
+        lines.append(f'          (number "{i+1}" (effects (font (size 1.27 1.27)))))')
+    lines.append(f'      )')
+    lines.append(f'    )')
+    return "\n".join(lines)
+
+def lib_sym_ws2812b():
+    """WS2812B LED: pin 1=VDD, pin 2=DOUT, pin 3=VSS, pin 4=DIN"""
+    return textwrap.dedent("""\
+    (symbol "LED:WS2812B"
+      (pin_names (offset 0.254))
+      (exclude_from_sim no) (in_bom yes) (on_board yes)
+      (property "Reference" "D" (at 0 6.35 0) (effects (font (size 1.27 1.27))))
+      (property "Value" "WS2812B" (at 0 -6.35 0) (effects (font (size 1.27 1.27))))
+      (property "Footprint" "LED_SMD:LED_WS2812B_PLCC4_5.0x5.0mm_P3.2mm" (at 0 0 0) (effects (font (size 1.27 1.27)) hide))
+      (property "Datasheet" "~" (at 0 0 0) (effects (font (size 1.27 1.27)) hide))
+      (symbol "WS2812B_0_1"
+        (rectangle (start -5.08 5.08) (end 5.08 -5.08)
+          (stroke (width 0.254) (type default)) (fill (type background))))
+      (symbol "WS2812B_1_1"
+        (pin power_in line (at 0 7.62 270) (length 2.54)
+          (name "VDD" (effects (font (size 1.27 1.27))))
+          (number "1" (effects (font (size 1.27 1.27)))))
+        (pin output line (at 7.62 0 180) (length 2.54)
+          (name "DOUT" (effects (font (size 1.27 1.27))))
+          (number "2" (effects (font (size 1.27 1.27)))))
+        (pin power_in line (at 0 -7.62 90) (length 2.54)
+          (name "VSS" (effects (font (size 1.27 1.27))))
+          (number "3" (effects (font (size 1.27 1.27)))))
+        (pin input line (at -7.62 0 0) (length 2.54)
+          (name "DIN" (effects (font (size 1.27 1.27))))
+          (number "4" (effects (font (size 1.27 1.27))))))
+    )""")
+
+def lib_sym_test_point():
+    return textwrap.dedent("""\
+    (symbol "Connector:TestPoint"
+      (pin_numbers hide) (pin_names (offset 0.762) hide)
+      (exclude_from_sim no) (in_bom no) (on_board yes)
+      (property "Reference" "TP" (at 0 3.81 0) (effects (font (size 1.27 1.27))))
+      (property "Value" "TestPoint" (at 0 -3.81 0) (effects (font (size 1.27 1.27))))
+      (property "Footprint" "TestPoint:TestPoint_Pad_1.0x1.0mm" (at 5.08 0 0) (effects (font (size 1.27 1.27)) hide))
+      (property "Datasheet" "~" (at 5.08 0 0) (effects (font (size 1.27 1.27)) hide))
+      (symbol "TestPoint_0_1"
+        (circle (center 0 1.27) (radius 0.762)
+          (stroke (width 0) (type default)) (fill (type none))))
+      (symbol "TestPoint_1_1"
+        (pin passive line (at 0 -1.27 90) (length 1.778)
+          (name "1" (effects (font (size 1.27 1.27))))
+          (number "1" (effects (font (size 1.27 1.27))))))
+    )""")
+
+def lib_sym_power(name, pin_num="1", value=None):
+    """Power symbol (GND, +3.3V, +5V, +12V, PWR_FLAG)."""
+    val = value or name
+    sym_id = f"power:{name}"
+    if name == "GND":
+        return textwrap.dedent(f"""\
+    (symbol "{sym_id}"
+      (power) (pin_numbers hide) (pin_names (offset 0) hide)
+      (exclude_from_sim no) (in_bom yes) (on_board yes)
+      (property "Reference" "#PWR" (at 0 -3.81 0) (effects (font (size 1.27 1.27)) hide))
+      (property "Value" "{val}" (at 0 -3.81 0) (effects (font (size 1.27 1.27))))
+      (property "Footprint" "" (at 0 0 0) (effects (font (size 1.27 1.27)) hide))
+      (property "Datasheet" "" (at 0 0 0) (effects (font (size 1.27 1.27)) hide))
+      (symbol "{name}_0_1"
+        (polyline (pts (xy 0 0) (xy 0 -1.27) (xy 1.27 -1.27) (xy 0 -2.54)
+            (xy -1.27 -1.27) (xy 0 -1.27))
+          (stroke (width 0) (type default)) (fill (type none))))
+      (symbol "{name}_1_1"
+        (pin power_in line (at 0 0 270) (length 0)
+          (name "{val}" (effects (font (size 1.27 1.27))))
+          (number "{pin_num}" (effects (font (size 1.27 1.27))))))
+    )""")
+    elif name == "PWR_FLAG":
+        return textwrap.dedent(f"""\
+    (symbol "{sym_id}"
+      (power) (pin_numbers hide) (pin_names (offset 0) hide)
+      (exclude_from_sim no) (in_bom no) (on_board yes)
+      (property "Reference" "#FLG" (at 0 1.905 0) (effects (font (size 1.27 1.27)) hide))
+      (property "Value" "PWR_FLAG" (at 0 3.81 0) (effects (font (size 1.27 1.27))))
+      (property "Footprint" "" (at 0 0 0) (effects (font (size 1.27 1.27)) hide))
+      (property "Datasheet" "~" (at 0 0 0) (effects (font (size 1.27 1.27)) hide))
+      (symbol "PWR_FLAG_0_0"
+        (pin power_out line (at 0 0 90) (length 0)
+          (name "pwr" (effects (font (size 1.27 1.27))))
+          (number "1" (effects (font (size 1.27 1.27))))))
+    )""")
+    else:
+        return textwrap.dedent(f"""\
+    (symbol "{sym_id}"
+      (power) (pin_numbers hide) (pin_names (offset 0) hide)
+      (exclude_from_sim no) (in_bom yes) (on_board yes)
+      (property "Reference" "#PWR" (at 0 3.81 0) (effects (font (size 1.27 1.27)) hide))
+      (property "Value" "{val}" (at 0 2.54 0) (effects (font (size 1.27 1.27))))
+      (property "Footprint" "" (at 0 0 0) (effects (font (size 1.27 1.27)) hide))
+      (property "Datasheet" "" (at 0 0 0) (effects (font (size 1.27 1.27)) hide))
+      (symbol "{name}_0_1"
+        (polyline (pts (xy -0.762 1.27) (xy 0 2.54) (xy 0.762 1.27))
+          (stroke (width 0) (type default)) (fill (type none)))
+        (pin power_in line (at 0 0 90) (length 1.27)
+          (name "{val}" (effects (font (size 1.27 1.27))))
+          (number "{pin_num}" (effects (font (size 1.27 1.27))))))
+    )""")
+
+LIB_SYMBOLS = {
+    "Device:R": lib_sym_resistor,
+    "Device:C": lib_sym_capacitor,
+    "Device:CP": lib_sym_capacitor_polar,
+    "Device:D_Schottky": lib_sym_diode_schottky,
+    "Device:D_TVS": lib_sym_diode_tvs,
+    "Device:Fuse": lib_sym_fuse,
+    "Device:Q_NMOS_GDS": lib_sym_nmos,
+    "Device:Q_PMOS_GSD": lib_sym_pmos,
+    "Regulator_Linear:AMS1117-3.3": lib_sym_ams1117,
+    "LED:WS2812B": lib_sym_ws2812b,
+    "Connector:TestPoint": lib_sym_test_point,
+}
+
+_CONN_RE = re.compile(r"Connector:Conn_01x(\d+)_Pin$")
+_PIN_NUMBER_RE = re.compile(r'\(number "([^"]*)"')
+# Unit sub-symbols are named "<name>_<unit>_<body style>"
+_UNIT_RE = re.compile(r'\(symbol "(?:[^"\\]|\\.)*_\d+_(\d+)"')
+_PIN_DEF_RE = re.compile(r'\(pin \w+ \w+\s+\(at ([-\d.]+) ([-\d.]+) [-\d.]+\).*?\(number "([^"]*)"',
+                         re.S)
+
+def _render_lib_sym(lib_id):
+    if lib_id in LIB_SYMBOLS:
+        return LIB_SYMBOLS[lib_id]()
+    nickname, _, name = lib_id.partition(":")
+    if nickname in _symbol_libraries:
+        from .symlib import load_symbol_library
+        library = load_symbol_library(_symbol_libraries[nickname])
+        if name in library:
+            return library.symbol_text(name, nickname)
+    m = _CONN_RE.match(lib_id)
+    if m:
+        return lib_sym_conn(int(m.group(1)))
+    if lib_id.startswith("power:"):
+        return lib_sym_power(lib_id[len("power:"):])
+    raise ValueError(f"no library symbol for lib_id {lib_id!r}")
+
+# nickname -> .kicad_sym path, see add_symbol_library()
+_symbol_libraries = {}
+
+def add_symbol_library(nickname, path):
+    """Take lib_ids "nickname:name" from the KiCad symbol library at `path`.
+    Only the symbols that are placed get parsed (see symlib.py)."""
+    if _symbol_libraries.get(nickname) == path:
+        return
+    _symbol_libraries[nickname] = path
+    # Forget what was rendered from a library previously registered under
+    # this nickname (another board's copy)
+    prefix = nickname + ":"
+    for cache in (_lib_sym_cache, _lib_pins, _lib_pin_defs):
+        for lib_id in [k for k in cache if k.startswith(prefix)]:
+            del cache[lib_id]
+    for key in [k for k in _lib_pin_offsets if k[0].startswith(prefix)]:
+        del _lib_pin_offsets[key]
+
+def symbol_library_stamps():
+    """(nickname, mtime_ns, size) of every registered library, for cache keys."""
+    stamps = []
+    for nickname, path in sorted(_symbol_libraries.items()):
+        st = os.stat(path)
+        stamps.append((nickname, st.st_mtime_ns, st.st_size))
+    return stamps
+
+ROTATIONS = {0: (1, 0), 90: (0, 1), 180: (-1, 0), 270: (0, -1)}  # degrees -> (cos, sin)
+
+# Rendered definitions, shared by every builder in the process
+_lib_sym_cache = {}
+_lib_pins = {}
+_lib_pin_defs = {}
+_lib_pin_offsets = {}
+
+def lib_sym_for(lib_id):
+    """Return the library symbol definition for `lib_id` (rendered once)."""
+    text = _lib_sym_cache.get(lib_id)
+    if text is None:
+        text = _render_lib_sym(lib_id)
+        _lib_sym_cache[lib_id] = text
+    return text
+
+def rendered_lib_syms():
+    """The definitions rendered so far, for seeding worker processes."""
+    return dict(_lib_sym_cache)
+
+def preload_lib_syms(rendered):
+    """Seed this process's cache with definitions rendered elsewhere."""
+    _lib_sym_cache.update(rendered)
+
+def _unit_text(text):
+    """The parts of definition `text` that hold the pins of its units, less
+    the De Morgan (body style 2) alternates, which repeat the same pins."""
+    units = [m for m in _UNIT_RE.finditer(text) if m.start() > text.index("(symbol")]
+    for i, m in enumerate(units):
+        if int(m.group(1)) <= 1:
+            yield text[m.end():units[i + 1].start() if i + 1 < len(units) else len(text)]
+
+def lib_sym_pins(lib_id):
+    """Pin numbers of `lib_id`, in definition order."""
+    pins = _lib_pins.get(lib_id)
+    if pins is None:
+        found = (num for part in _unit_text(lib_sym_for(lib_id))
+                 for num in _PIN_NUMBER_RE.findall(part))
+        pins = tuple(dict.fromkeys(found))
+        _lib_pins[lib_id] = pins
+    return pins
+
+def lib_sym_pin_defs(lib_id):
+    """((number, x, y), ...) of `lib_id`'s pins: connection points in
+    library coordinates (y up), in definition order."""
+    defs = _lib_pin_defs.get(lib_id)
+    if defs is None:
+        found = {}
+        for part in _unit_text(lib_sym_for(lib_id)):
+            for x, y, num in _PIN_DEF_RE.findall(part):
+                found.setdefault(num, (num, float(x), float(y)))
+        defs = tuple(found.values())
+        _lib_pin_defs[lib_id] = defs
+    return defs
+
+def lib_sym_pin_offsets(lib_id, rot=0, mirror=False):
+    """{number: (dx, dy)} in nanometres from the origin of a `lib_id`
+    instance placed at `rot` degrees (optionally mirrored) to each of its
+    pins, in schematic coordinates (y down).  Cached per (lib_id, rot,
+    mirror)."""
+    key = (lib_id, rot, mirror)
+    offsets = _lib_pin_offsets.get(key)
+    if offsets is None:
+        c, s = ROTATIONS[rot % 360]
+        offsets = {}
+        for num, px, py in lib_sym_pin_defs(lib_id):
+            # Rotate counter-clockwise in library coordinates (y up) ...
+            rx, ry = px * c - py * s, px * s + py * c
+            if mirror:
+                ry = -ry
+            # ... then flip y into schematic coordinates (y down)
+            offsets[num] = (to_nm(rx), -to_nm(ry))
+        _lib_pin_offsets[key] = offsets
+    return offsets
@@ -0,0 +1,94 @@
+"""
+Back-annotation: carry the layout of a schematic edited in KiCad over to a
+freshly built one.
+
+Components, values, footprints and connections come from the builder; the
+position, rotation and mirroring of every item come from the edited file.
+Items are matched by UUID, which KiCad keeps when items are moved, and
+components that were re-created in KiCad fall back to their reference.
+Everything else drawn in KiCad is kept: wires, junctions, no-connects,
+global and local labels, power symbols, and text and graphics as written.
+It is told apart from items an earlier build generated by its UUID: the
+builder's are name-based (version 5, see builder.stable_uuid()), the
+generator before it numbered them a0000000-0000-4000-8000-<n>, and KiCad's
+are random, so a generated item the builder no longer produces is dropped
+rather than carried over.  Everything is a dict lookup per item.
+"""
+
+import uuid
+
+# UUIDs of the generator before name-based UUIDs, followed by a counter
+_COUNTER_PREFIX = "a0000000-0000-4000-8000-"
+
+from .items import Symbol, Power, Label, Wire, Junction, NoConnect
+from .schfile import read_schematic
+
+
+def _orientation(sym):
+    """(rot, mirror) of a file symbol as the builder writes them.  Mirroring
+    about y is mirroring about x turned by 180 degrees."""
+    if sym.mirror == "y":
+        return (sym.rot + 180) % 360, True
+    return sym.rot, sym.mirror == "x"
+
+
+def _drawn(item):
+    """True if `item` of an edited file was drawn in KiCad rather than
+    written by a build."""
+    if item.uuid is not None and item.uuid.startswith(_COUNTER_PREFIX):
+        return False
+    try:
+        return uuid.UUID(item.uuid).version != 5
+    except (TypeError, ValueError):
+        return True  # no or malformed UUID: not one of ours
+
+
+def merge_layout(sb, sch):
+    """Move the items of SchematicBuilder `sb` to where Schematic `sch` (see
+    schfile.py) has them, and add everything but components that was drawn
+    in KiCad and only `sch` has.  Return (items moved, items added)."""
+    moved = 0
+    for item in sb.items:
+        old = sch.by_uuid.get(item.uuid)
+        if isinstance(item, Symbol):
+            if old is None and not isinstance(item, Power):
+                old = sch.symbols.get((item.ref, 1))
+            if not isinstance(old, Symbol):
+                continue
+            place = (old.x, old.y) + _orientation(old)
+            if place != (item.x, item.y, item.rot, item.mirror):
+                item.x, item.y, item.rot, item.mirror = place
+                moved += 1
+        elif isinstance(item, Wire):
+            if isinstance(old, Wire) and (old.x1, old.y1, old.x2, old.y2) != (
+                    item.x1, item.y1, item.x2, item.y2):
+                item.x1, item.y1, item.x2, item.y2 = old.x1, old.y1, old.x2, old.y2
+                moved += 1
+        elif isinstance(item, Label):
+            if isinstance(old, Label) and (old.x, old.y, old.rot) != (item.x, item.y, item.rot):
+                item.x, item.y, item.rot = old.x, old.y, old.rot
+                moved += 1
+        elif isinstance(item, (Junction, NoConnect)):
+            if type(old) is type(item) and (old.x, old.y) != (item.x, item.y):
+                item.x, item.y = old.x, old.y
+                moved += 1
+
+    known = {item.uuid for item in sb.items}
+    added = 0
+    for item in sch.items:
+        if item.uuid in known or not _drawn(item):
+            continue
+        if isinstance(item, Power):
+            # Renumbered so it cannot collide with the build's #PWR/#FLG refs
+            item.rot, item.mirror = _orientation(item)
+            item.ref = sb._flg_ref() if item.value == "PWR_FLAG" else sb._pwr_ref()
+        elif isinstance(item, Symbol):
+            continue  # components come from the builder only
+        sb.items.append(item)
+        added += 1
+    return moved, added
+
+
+def merge_file(sb, path):
+    """merge_layout() from the .kicad_sch at `path`."""
+    return merge_layout(sb, read_schematic(path))
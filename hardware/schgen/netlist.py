@@ -0,0 +1,185 @@
+"""
+Connectivity of a SchematicBuilder: which pins end up on which net.
+
+Every connection point (wire ends, symbol pins, labels, power symbols,
+junctions) is an exact integer-nanometre position interned in a dict, so
+coincident points meet in O(1).  Wires union their
+two ends in a union-find.  Points that land inside a wire rather than on its
+end are found through a uniform grid of wire bounding boxes.  Global labels
+and power symbols then join every component that carries the same name.
+Everything is near-linear in the number of items.
+
+Run: python -m schgen.netlist [board ...]    (from hardware/)
+"""
+
+import sys
+
+from .items import Symbol, Power, Label, Wire, Junction
+from .library import lib_sym_pin_offsets
+from .units import to_nm
+
+CELL = to_nm(10.16)  # wire index cell size, nm
+
+
+def symbol_pin_points(sym):
+    """Yield (pin number, x, y) of `sym`'s pins in schematic coordinates."""
+    for num, (dx, dy) in lib_sym_pin_offsets(sym.lib_id, sym.rot, sym.mirror).items():
+        yield num, sym.x + dx, sym.y + dy
+
+
+class _UnionFind:
+    __slots__ = ("parent",)
+
+    def __init__(self):
+        self.parent = []
+
+    def add(self):
+        self.parent.append(len(self.parent))
+        return len(self.parent) - 1
+
+    def find(self, i):
+        parent = self.parent
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    def union(self, a, b):
+        a, b = self.find(a), self.find(b)
+        if a != b:
+            self.parent[b] = a
+
+
+def extract_netlist(sb, pin_points=symbol_pin_points):
+    """Return {net name: [(ref, pin), ...]} for the components in `sb`.
+
+    Nets named by a power symbol take its value, otherwise the first global
+    label in sorted order; unnamed nets are called "Net-(REF-PadN)" after
+    their first pin, as KiCad does.  `pin_points(sym)` yields a symbol's
+    (pin, x, y); the default takes them from the library definitions.
+    """
+    uf = _UnionFind()
+    points = {}  # (x, y) -> union-find node
+
+    def node(x, y):
+        n = points.get((x, y))
+        if n is None:
+            n = points[(x, y)] = uf.add()
+        return n
+
+    pins = []    # (node, ref, pin)
+    names = {}   # net name -> first node carrying it
+    power_names = set()
+    anchors = []  # (x, y, node) that may sit inside another wire
+    wires = []
+
+    for item in sb.items:
+        if isinstance(item, Wire):
+            a, b = node(item.x1, item.y1), node(item.x2, item.y2)
+            uf.union(a, b)
+            w = (item.x1, item.y1, item.x2, item.y2)
+            wires.append(w)
+            # A wire ending on another wire's interior is a T-join
+            anchors.append((w[0], w[1], a))
+            anchors.append((w[2], w[3], b))
+        elif isinstance(item, Power):
+            n = node(item.x, item.y)
+            if item.value != "PWR_FLAG":
+                power_names.add(item.value)
+                uf.union(names.setdefault(item.value, n), n)
+            anchors.append((item.x, item.y, n))
+        elif isinstance(item, Symbol):
+            for num, x, y in pin_points(item):
+                n = node(x, y)
+                pins.append((n, item.ref, num))
+                anchors.append((x, y, n))
+        elif isinstance(item, Label):
+            n = node(item.x, item.y)
+            uf.union(names.setdefault(item.name, n), n)
+            anchors.append((item.x, item.y, n))
+        elif isinstance(item, Junction):
+            n = node(item.x, item.y)
+            anchors.append((item.x, item.y, n))
+
+    _attach_to_wire_interiors(wires, anchors, points, uf)
+
+    # Name the nets
+    net_name = {}
+    for name in sorted(names, key=lambda nm: (nm not in power_names, nm)):
+        net_name.setdefault(uf.find(names[name]), name)
+
+    nets = {}
+    for n, ref, num in sorted(pins, key=lambda p: (natural_key(p[1]), natural_key(p[2]))):
+        root = uf.find(n)
+        name = net_name.get(root)
+        if name is None:
+            name = net_name[root] = f"Net-({ref}-Pad{num})"
+        nets.setdefault(name, []).append((ref, num))
+    return nets
+
+
+def _attach_to_wire_interiors(wires, anchors, points, uf):
+    """Union anchors lying inside a wire with that wire."""
+    index = WireIndex(wires, CELL)
+    for x, y, n in anchors:
+        for x1, y1, _, _ in index.wires_at(x, y):
+            uf.union(points[(x1, y1)], n)
+
+
+class WireIndex:
+    """Uniform grid over wire bounding boxes, for finding the wires that pass
+    through a point.  Wires, points and the grid pitch `cell` are in
+    nanometres."""
+    __slots__ = ("wires", "boxes", "cell", "cells")
+
+    def __init__(self, wires, cell):
+        self.wires = wires
+        self.boxes = []
+        self.cell = cell
+        self.cells = {}
+        for w, (x1, y1, x2, y2) in enumerate(wires):
+            x0, x9 = (x1, x2) if x1 <= x2 else (x2, x1)
+            y0, y9 = (y1, y2) if y1 <= y2 else (y2, y1)
+            self.boxes.append((x0, x9, y0, y9))
+            for cx in range(x0 // cell, x9 // cell + 1):
+                for cy in range(y0 // cell, y9 // cell + 1):
+                    self.cells.setdefault((cx, cy), []).append(w)
+
+    def wires_at(self, x, y):
+        """Wires (x1, y1, x2, y2) that (x, y) lies on, ends included."""
+        cell = self.cell
+        boxes, wires = self.boxes, self.wires
+        for w in self.cells.get((x // cell, y // cell), ()):
+            x0, x9, y0, y9 = boxes[w]
+            if x0 <= x <= x9 and y0 <= y <= y9:
+                x1, y1, x2, y2 = wires[w]
+                if (x0 == x9 or y0 == y9
+                        or (x2 - x1) * (y - y1) == (y2 - y1) * (x - x1)):
+                    yield wires[w]
+
+
+def natural_key(s):
+    """Natural sort key: R3 < R10, "2" < "10"."""
+    head = s.rstrip("0123456789")
+    tail = s[len(head):]
+    return (head, int(tail) if tail else -1, s)
+
+
+def format_netlist(nets):
+    """Yield one "NET -> REF.PIN, REF.PIN" line per net, sorted by name."""
+    for name in sorted(nets, key=natural_key):
+        yield f"{name} -> " + ", ".join(f"{ref}.{pin}" for ref, pin in nets[name])
+
+
+def main(argv=None):
+    from .cli import find_boards, load_board
+    boards = (sys.argv[1:] if argv is None else argv) or find_boards()
+    for name in boards:
+        print(f"# {name}")
+        nets = extract_netlist(load_board(name).build_schematic())
+        for line in format_netlist(nets):
+            print(line)
+
+
+if __name__ == "__main__":
+    main()
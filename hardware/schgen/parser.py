@@ -0,0 +1,205 @@
+"""
+KiCad S-expression reader.
+
+load() decodes an mmap of a .kicad_sch / .kicad_sym / .kicad_mod file once,
+tokenizes it in a single re.split() pass and builds SList nodes from the
+token stream without recursion.  Atoms are kept as
+their raw text (quoted strings keep their quotes and escapes), and every item
+remembers the whitespace in front of it, so dumps(load(path)) reproduces the
+file byte for byte.  Repeated atoms and whitespace runs are shared, which
+keeps a 40k-line schematic compact in memory.
+"""
+
+import gc
+import mmap
+import re
+
+# Tokens: "(", ")", a quoted string or a bare atom.  re.split() with this
+# pattern alternates [whitespace, token, whitespace, token, ..., whitespace].
+_TOKEN_RE = re.compile(r'([()]|"[^"\\]*(?:\\.[^"\\]*)*"|[^ \t\r\n()"]+)')
+
+
+class SList:
+    """One parenthesised list.
+
+    items  children: str for atoms, SList for nested lists
+    space  whitespace preceding each child (parallel to items)
+    tail   whitespace before the closing parenthesis
+    """
+    __slots__ = ("items", "space", "tail")
+
+    def __init__(self, items=None, space=None, tail=""):
+        self.items = items if items is not None else []
+        self.space = space if space is not None else []
+        self.tail = tail
+
+    @property
+    def head(self):
+        """The leading atom (e.g. "symbol", "wire"), or None."""
+        if self.items and isinstance(self.items[0], str):
+            return self.items[0]
+        return None
+
+    def __iter__(self):
+        return iter(self.items)
+
+    def __len__(self):
+        return len(self.items)
+
+    def __getitem__(self, i):
+        return self.items[i]
+
+    def __repr__(self):
+        return f"SList({self.head!r}, {len(self.items)} items)"
+
+    def lists(self, head=None):
+        """Child lists, optionally only those whose head is `head`."""
+        for item in self.items:
+            if isinstance(item, SList) and (head is None or item.head == head):
+                yield item
+
+    def get(self, head):
+        """First child list whose head is `head`, or None."""
+        return next(self.lists(head), None)
+
+    def value(self, index=1):
+        """Atom at `index`, unquoted."""
+        return unquote(self.items[index])
+
+    def property(self, name):
+        """Value of (property "name" "value" ...), or None."""
+        for p in self.lists("property"):
+            if unquote(p.items[1]) == name:
+                return unquote(p.items[2])
+        return None
+
+
+def unquote(atom):
+    """Value of a raw atom: quotes removed and escapes resolved."""
+    if atom[:1] != '"':
+        return atom
+    s = atom[1:-1]
+    if "\\" in s:
+        s = re.sub(r'\\(.)', lambda m: {"n": "\n", "t": "\t"}.get(m.group(1), m.group(1)), s)
+    return s
+
+
+def quote(s):
+    """Raw atom for string `s`."""
+    return '"' + s.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n") + '"'
+
+
+def parse(data):
+    """Parse bytes-like `data`; return the document as a root SList whose
+    items are the top-level lists (normally one (kicad_sch ...))."""
+    parts = _TOKEN_RE.split(str(data, "utf-8"))
+    gaps = parts[0::2]
+    if "".join(gaps).strip(" \t\r\n"):
+        raise ValueError("unterminated string or stray character in input")
+
+    root = SList()
+    stack = []
+    cur = root
+    items, space = cur.items, cur.space
+    share = {}.setdefault  # intern repeated atoms and whitespace runs
+    # Only acyclic containers are created; skip the collector passes
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        for ws, tok in zip(gaps, parts[1::2]):
+            if tok == "(":
+                node = SList()
+                items.append(node)
+                space.append(share(ws, ws))
+                stack.append(cur)
+                cur = node
+                items, space = node.items, node.space
+            elif tok == ")":
+                if not stack:
+                    raise ValueError("unbalanced ')'")
+                cur.tail = share(ws, ws)
+                cur = stack.pop()
+                items, space = cur.items, cur.space
+            else:
+                items.append(share(tok, tok))
+                space.append(share(ws, ws))
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+    if stack:
+        raise ValueError(f"{len(stack)} unclosed '(' at end of input")
+    root.tail = gaps[-1]
+    return root
+
+
+def load(path):
+    """Parse the file at `path` through an mmap of it."""
+    with open(path, "rb") as f:
+        try:
+            buf = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:  # empty file
+            return parse(b"")
+        with buf:
+            return parse(buf)
+
+
+# The same tokens in bytes, for scanning an mmap without decoding all of it
+_TOKEN_BYTES_RE = re.compile(_TOKEN_RE.pattern[1:-1].encode())
+
+
+def iter_lists(path):
+    """Yield the lists inside the file's top-level list (the items of
+    (kicad_sch ...)) one at a time, so memory holds one item rather than the
+    whole tree.  Whitespace is not kept: each item gets a single space."""
+    with open(path, "rb") as f:
+        try:
+            buf = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:  # empty file
+            return
+        with buf:
+            share = {}.setdefault
+            stack = []
+            cur = None
+            for m in _TOKEN_BYTES_RE.finditer(buf):
+                tok = m.group()
+                if tok == b"(":
+                    node = SList()
+                    if cur is not None:
+                        cur.items.append(node)
+                        cur.space.append(" ")
+                        stack.append(cur)
+                    cur = node
+                elif tok == b")":
+                    if cur is None:
+                        raise ValueError("unbalanced ')'")
+                    if not stack:
+                        return  # end of the top-level list
+                    node, cur = cur, stack.pop()
+                    if not stack:
+                        cur.items.pop()
+                        cur.space.pop()
+                        yield node
+                elif cur is not None:
+                    tok = str(tok, "utf-8")
+                    cur.items.append(share(tok, tok))
+                    cur.space.append(" ")
+            if cur is not None:
+                raise ValueError(f"{len(stack) + 1} unclosed '(' at end of input")
+
+
+def iter_text(node):
+    """Yield the text of `node` in pieces (see dumps())."""
+    for space, item in zip(node.space, node.items):
+        yield space
+        if isinstance(item, SList):
+            yield "("
+            yield from iter_text(item)
+            yield ")"
+        else:
+            yield item
+    yield node.tail
+
+
+def dumps(node):
+    """Text of a root from parse()/load(), or of a list's contents."""
+    return "".join(iter_text(node))
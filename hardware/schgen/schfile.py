@@ -0,0 +1,167 @@
+"""
+Read an existing .kicad_sch (generated, or drawn and edited in KiCad) back
+into item records.
+
+The file is streamed with parser.iter_lists() and every top-level item is
+reduced to the record the builder would have made for it as soon as it is
+read, so memory grows with the number of items rather than the file size.
+Pin positions come from the file's own lib_symbols block, which lets parts
+from any library connect as drawn.
+
+Coordinates are integer nanometres (see units.py).
+"""
+
+from .items import Symbol, Power, Label, Wire, Junction, NoConnect, RawItem
+from .library import ROTATIONS
+from .parser import SList, iter_lists, unquote
+from .units import to_nm
+
+_STANDARD_PROPS = ("Reference", "Value", "Footprint", "Datasheet")
+# Top-level lists that describe the file rather than the drawing; the
+# writer makes its own
+_FILE_HEADS = frozenset(("version", "generator", "generator_version", "uuid", "paper",
+                         "lib_symbols", "sheet_instances", "symbol_instances",
+                         "embedded_fonts"))
+
+
+class FileSymbol(Symbol):
+    """Component read from a file.  `mirror` is "x", "y" or "" as written,
+    and `unit` the unit placed (1 for single-unit parts)."""
+    __slots__ = ("unit",)
+
+
+class Schematic:
+    """Items of one .kicad_sch file.
+
+    items     records in file order
+    symbols   (ref, unit) -> FileSymbol
+    by_uuid   uuid -> record
+    lib_pins  lib_id -> ((unit, number, x, y), ...) in library coordinates
+              (y up, nm); unit 0 pins belong to every unit
+    """
+    __slots__ = ("path", "items", "symbols", "by_uuid", "lib_pins")
+
+    def __init__(self, path):
+        self.path = path
+        self.items = []
+        self.symbols = {}
+        self.by_uuid = {}
+        self.lib_pins = {}
+
+    def pin_points(self, sym):
+        """Yield (pin number, x, y) of `sym` in schematic coordinates; the
+        pin_points of netlist.extract_netlist() for this file."""
+        c, s = ROTATIONS[sym.rot % 360]
+        unit = getattr(sym, "unit", 1)
+        for pin_unit, num, px, py in self.lib_pins.get(sym.lib_id, ()):
+            if pin_unit and pin_unit != unit:
+                continue
+            rx, ry = px * c - py * s, px * s + py * c
+            if sym.mirror == "x":
+                ry = -ry
+            elif sym.mirror == "y":
+                rx = -rx
+            yield num, sym.x + rx, sym.y - ry
+
+
+def _at(node):
+    """(x, y, rot) of a list's (at x y [rot]) child, in nm and degrees."""
+    at = node.get("at")
+    rot = round(float(at.items[3])) if len(at.items) > 3 else 0
+    return to_nm(float(at.items[1])), to_nm(float(at.items[2])), rot
+
+
+def _uuid(node):
+    u = node.get("uuid")
+    return u.value() if u is not None else None
+
+
+def _lib_pins(lib_symbols):
+    """{lib_id: ((unit, number, x, y), ...)} and the set of power lib_ids."""
+    pins = {}
+    power = set()
+    for sym in lib_symbols.lists("symbol"):
+        lib_id = sym.value(1)
+        if sym.get("power") is not None:
+            power.add(lib_id)
+        found = []
+        for body in sym.lists("symbol"):
+            # Units are named "<name>_<unit>_<body style>"; skip De Morgan bodies
+            _, unit, style = body.value(1).rsplit("_", 2)
+            if int(style) > 1:
+                continue
+            for pin in body.lists("pin"):
+                at = pin.get("at")
+                found.append((int(unit), pin.get("number").value(),
+                              to_nm(float(at.items[1])), to_nm(float(at.items[2]))))
+        pins[lib_id] = tuple(found)
+    return pins, power
+
+
+def _symbol(node, power_ids):
+    lib_id = node.get("lib_id").value()
+    x, y, rot = _at(node)
+    mirror = node.get("mirror")
+    mirror = mirror.value() if mirror is not None else ""
+    unit = node.get("unit")
+    unit = int(unit.value()) if unit is not None else 1
+    props = {p.value(1): p.value(2) for p in node.lists("property")}
+    ref = props.get("Reference", "")
+    extra = {k: v for k, v in props.items() if k not in _STANDARD_PROPS}
+    pins = tuple((p.value(1), _uuid(p)) for p in node.lists("pin"))
+    args = (lib_id, ref, props.get("Value", ""), x, y, rot, props.get("Footprint", ""),
+            mirror, extra, pins, _uuid(node))
+    if lib_id in power_ids or ref.startswith("#"):
+        return Power(*args)
+    sym = FileSymbol(*args)
+    sym.unit = unit
+    return sym
+
+
+def _sexpr(node):
+    """One-line text of list `node`."""
+    return "(" + " ".join(_sexpr(item) if isinstance(item, SList) else item
+                          for item in node.items) + ")"
+
+
+def read_schematic(path):
+    """Stream the .kicad_sch at `path` into a Schematic.
+
+    Symbols, global and local labels, wires, junctions and no-connects
+    become records; text, graphics and any other drawn item are kept as
+    RawItems, and the file metadata is skipped.
+    """
+    sch = Schematic(path)
+    power_ids = set()
+    for node in iter_lists(path):
+        head = node.head
+        if head == "symbol":
+            item = _symbol(node, power_ids)
+            if not isinstance(item, Power):
+                sch.symbols[(item.ref, item.unit)] = item
+        elif head == "wire":
+            (x1, y1), (x2, y2) = [(to_nm(float(p.items[1])), to_nm(float(p.items[2])))
+                                  for p in node.get("pts").lists("xy")]
+            item = Wire(x1, y1, x2, y2, _uuid(node))
+        elif head in ("global_label", "label"):
+            x, y, rot = _at(node)
+            shape = node.get("shape")
+            item = Label(unquote(node.items[1]), x, y, rot,
+                         shape.value() if shape is not None else None, _uuid(node))
+        elif head == "junction":
+            x, y, _ = _at(node)
+            item = Junction(x, y, _uuid(node))
+        elif head == "no_connect":
+            x, y, _ = _at(node)
+            item = NoConnect(x, y, _uuid(node))
+        elif head == "lib_symbols":
+            sch.lib_pins, power_ids = _lib_pins(node)
+            continue
+        elif head in _FILE_HEADS:
+            continue
+        else:
+            item = RawItem(_sexpr(node), _uuid(node))
+        sch.items.append(item)
+        if item.uuid is not None:
+            sch.by_uuid[item.uuid] = item
+    return sch
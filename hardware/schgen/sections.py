@@ -0,0 +1,184 @@
+"""
+Build a board from its section functions, optionally in a process pool and
+with an on-disk cache of unchanged sections.
+
+A section is a top-level function `section(sb, **params)` that adds items to
+the SchematicBuilder it is given.  Boards list them in the order they are
+written to the schematic; `params` selects a parametric variant and is
+passed to every section.
+
+A section that grows with a parameter (e.g. a driver array with one block
+per channel) can be split: give it a `chunks` attribute, a function of the
+params returning the number of chunks, and it is called once per chunk
+with `chunk=i` added to the params.  Each chunk is built, cached and pooled
+like a section of its own and the chunks are merged in order, so the
+section must place the same items across its chunks as it does in one
+call without `chunk`.
+"""
+
+import glob
+import hashlib
+import os
+import pickle
+
+from .builder import SchematicBuilder
+from .cache import unpickle, write_atomic
+from .library import symbol_library_stamps
+
+CACHE_DIRNAME = ".schematic_cache"
+
+
+def _build_section(section, params):
+    """Process-pool worker: build one section into its own builder."""
+    sb = SchematicBuilder()
+    section(sb, **params)
+    return sb
+
+
+def _parts(sections, params, keys=None):
+    """(name, section, params, key) of each part to build: a section, or
+    one chunk of a split section."""
+    keys = keys or [None] * len(sections)
+    for section, key in zip(sections, keys):
+        chunks = getattr(section, "chunks", None)
+        if chunks is None:
+            yield section.__name__, section, params, key
+            continue
+        for i in range(chunks(**params)):
+            yield f"{section.__name__}.{i}", section, {**params, "chunk": i}, key
+
+
+def build_sections(sections, jobs=1, cache_dir=None, params=None):
+    """Build every section; with jobs > 1 the sections (and the chunks of
+    split sections) are built in a process pool and merged in order,
+    giving the same result as the serial build.
+
+    With `cache_dir`, each built section is pickled there under a hash of
+    its inputs and reused by later runs while that hash is unchanged.
+    """
+    params = params or {}
+    sb = SchematicBuilder()
+    if cache_dir is None and jobs <= 1:
+        for _, section, part_params, _ in _parts(sections, params):
+            section(sb, **part_params)
+        return sb
+
+    keys = section_keys(sections, params) if cache_dir is not None else None
+    todo = list(_parts(sections, params, keys))
+    parts = [None] * len(todo)
+    if cache_dir is not None:
+        for i, (name, _, _, key) in enumerate(todo):
+            parts[i] = _load_section(cache_dir, name, key)
+    missing = [i for i, part in enumerate(parts) if part is None]
+
+    if jobs > 1 and len(missing) > 1:
+        from concurrent.futures import ProcessPoolExecutor
+        with ProcessPoolExecutor(max_workers=min(jobs, len(missing))) as pool:
+            built = list(pool.map(_build_section, [todo[i][1] for i in missing],
+                                  [todo[i][2] for i in missing]))
+    else:
+        built = [_build_section(todo[i][1], todo[i][2]) for i in missing]
+    for i, part in zip(missing, built):
+        parts[i] = part
+        if cache_dir is not None:
+            name, _, _, key = todo[i]
+            _store_section(cache_dir, name, key, part)
+
+    for part in parts:
+        sb.merge(part)
+    return sb
+
+
+# ---------------------------------------------------------------------------
+# Section keys
+# ---------------------------------------------------------------------------
+_package_digest = None
+_file_lines = {}
+
+def _package_source_digest():
+    """Hash of this package's sources: the builder, records and library
+    symbols that every section's output depends on."""
+    global _package_digest
+    if _package_digest is None:
+        h = hashlib.sha256()
+        for path in sorted(glob.glob(os.path.join(os.path.dirname(__file__), "*.py"))):
+            with open(path, "rb") as f:
+                h.update(f.read())
+        _package_digest = h.hexdigest()
+    return _package_digest
+
+def _source_lines(path):
+    """Lines of source file `path`, reread when it changes (watch mode
+    reloads edited boards into the same process)."""
+    stamp = os.stat(path).st_mtime_ns
+    hit = _file_lines.get(path)
+    if hit is None or hit[0] != stamp:
+        with open(path, encoding="utf-8") as f:
+            hit = _file_lines[path] = (stamp, f.readlines())
+    return hit[1]
+
+def _function_source(lines, fn):
+    """Source lines of top-level function `fn`: its def line up to the next
+    unindented line (inspect.getsource() is too slow for every run)."""
+    start = fn.__code__.co_firstlineno - 1
+    end = start + 1
+    while end < len(lines) and (not lines[end].strip() or lines[end][0] in " \t"):
+        end += 1
+    while not lines[end - 1].strip():
+        end -= 1
+    return "".join(lines[start:end])
+
+def section_keys(sections, params=None):
+    """Per-section hash of the section's source, the rest of its board
+    module (shared tables and helpers), this package, the registered
+    symbol libraries and `params`."""
+    common = {}  # board file -> source without its sections
+    sources = []
+    for section in sections:
+        path = section.__code__.co_filename
+        lines = _source_lines(path)
+        src = _function_source(lines, section)
+        common[path] = common.get(path, "".join(lines)).replace(src, "")
+        sources.append(src)
+    base = hashlib.sha256(_package_source_digest().encode())
+    base.update(repr(sorted((params or {}).items())).encode())
+    base.update(repr(symbol_library_stamps()).encode())
+    for path in sorted(common):
+        base.update(common[path].encode())
+    base = base.hexdigest()
+    return [hashlib.sha256((base + src).encode()).hexdigest()[:16]
+            for src in sources]
+
+
+# ---------------------------------------------------------------------------
+# On-disk section cache
+# ---------------------------------------------------------------------------
+# Pickled sections already read or written by this process, by path, so a
+# long-running process (watch mode) does not go back to the disk for them
+_warm = {}
+
+def _section_path(cache_dir, name, key):
+    return os.path.join(cache_dir, f"{name}-{key}.pickle")
+
+def _load_section(cache_dir, name, key):
+    path = _section_path(cache_dir, name, key)
+    data = _warm.get(path)
+    if data is None:
+        try:
+            with open(path, "rb") as f:
+                data = _warm[path] = f.read()
+        except OSError:
+            return None
+    # Unpickled afresh every time: merge() renumbers the items it takes
+    return unpickle(data)
+
+def _store_section(cache_dir, name, key, part):
+    os.makedirs(cache_dir, exist_ok=True)
+    path = _section_path(cache_dir, name, key)
+    # Drop entries for older versions of this section
+    for fn in os.listdir(cache_dir):
+        if fn.startswith(f"{name}-") and fn.endswith(".pickle"):
+            os.remove(os.path.join(cache_dir, fn))
+            _warm.pop(os.path.join(cache_dir, fn), None)
+    data = _warm[path] = pickle.dumps(part, protocol=pickle.HIGHEST_PROTOCOL)
+    write_atomic(path, data)
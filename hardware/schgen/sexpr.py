@@ -0,0 +1,20 @@
+"""S-expression formatting helpers for schematic items.
+
+Coordinates are integer nanometres (see units.py).
+"""
+
+from .units import mm
+
+
+def xy(x, y):
+    return f"(xy {mm(x)} {mm(y)})"
+
+def at(x, y, rot=0):
+    return f"(at {mm(x)} {mm(y)} {rot})"
+
+def effects(size=1.27, hide=False):
+    h = " hide" if hide else ""
+    return f"(effects (font (size {size} {size})){h})"
+
+def prop(name, value, x, y, rot=0, size=1.27, hide=False):
+    return f'    (property "{name}" "{value}" {at(x, y, rot)} {effects(size, hide)})'
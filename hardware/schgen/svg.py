@@ -0,0 +1,303 @@
+"""
+Headless SVG preview of a SchematicBuilder, for reviewing a board without
+KiCad (e.g. as a CI artifact).
+
+Library symbols are drawn from their own graphics (rectangles, polylines,
+circles, arcs and pins in lib_sym_for()).  Each (lib_id, rot, mirror)
+orientation is transformed once into a <defs> group and every instance is a
+<use> translated to its position, so the cost per placed part is one line
+of output and a multi-channel variant renders in about the time it takes to
+build.  Wires, junctions, no-connects, labels, text and section borders are
+drawn directly.  Only unit 1 and the common unit of a symbol are drawn, as
+the builder places no other units.
+
+Run: python -m schgen.svg [board ...] [-o DIR]    (from hardware/)
+"""
+
+import argparse
+import math
+import os
+import sys
+from html import escape
+
+from .items import (PROPERTY_OFFSET, Symbol, Power, Label, Wire, Junction, NoConnect, Text, Rect,
+                    RawItem)
+from .library import ROTATIONS, lib_sym_for
+from .parser import parse
+from .units import mm, to_nm
+
+PAGE = (to_nm(420), to_nm(297))  # A3, as the schematic's (paper "A3")
+MARGIN = to_nm(10)
+JUNCTION_R = to_nm(0.4572)
+NO_CONNECT = to_nm(0.635)  # half the size of the cross
+
+STYLE = """\
+  <style>
+    .sym { stroke: #840000; stroke-width: 0.254; fill: none; stroke-linecap: round; stroke-linejoin: round }
+    .sym .o { fill: #840000 }
+    .sym .b { fill: #ffffc2 }
+    .pin { stroke: #840000; stroke-width: 0.1524 }
+    .w { stroke: #008400; stroke-width: 0.1524; stroke-linecap: round }
+    .j { fill: #008400 }
+    .nc { stroke: #0000c8; stroke-width: 0.1524 }
+    .brd { stroke: #840084; stroke-width: 0.254; stroke-dasharray: 2 1; fill: none }
+    text { font-family: sans-serif; font-size: 1.27px; fill: #006464 }
+    .lbl { fill: #840000 }
+    .ttl { fill: #840084; font-weight: bold }
+  </style>
+"""
+
+
+# -- library graphics ---------------------------------------------------------
+
+def _unit_drawn(name):
+    """Whether sub-symbol `name` ("R_0_1", "R_1_1", "X_2_1", ...) belongs
+    to unit 1 (or all units) in the normal body style."""
+    parts = name.rsplit("_", 2)
+    return len(parts) < 3 or (parts[1] in ("0", "1") and parts[2] in ("0", "1"))
+
+
+def _fill(node):
+    fill = node.get("fill")
+    kind = fill.get("type").value() if fill is not None and fill.get("type") else "none"
+    return {"outline": "o", "background": "b"}.get(kind, "")
+
+
+def _point(node):
+    return float(node.items[1]), float(node.items[2])
+
+
+def _graphics(node, out):
+    """Append the primitives of symbol `node` in library coordinates (mm,
+    y up) to `out`: ("poly", points, fill, closed), ("circle", center,
+    radius, fill), ("arc", start, mid, end, fill)."""
+    for child in node.lists():
+        head = child.head
+        if head == "symbol":
+            if _unit_drawn(child.value()):
+                _graphics(child, out)
+        elif head == "rectangle":
+            (x1, y1), (x2, y2) = _point(child.get("start")), _point(child.get("end"))
+            out.append(("poly", ((x1, y1), (x2, y1), (x2, y2), (x1, y2)), _fill(child), True))
+        elif head == "polyline":
+            pts = tuple(_point(p) for p in child.get("pts").lists("xy"))
+            out.append(("poly", pts, _fill(child), False))
+        elif head == "circle":
+            radius = float(child.get("radius").items[1])
+            out.append(("circle", _point(child.get("center")), radius, _fill(child)))
+        elif head == "arc" and child.get("mid") is not None:
+            out.append(("arc", _point(child.get("start")), _point(child.get("mid")),
+                        _point(child.get("end")), _fill(child)))
+        elif head == "pin" and "hide" not in child.items:
+            at = child.get("at")
+            x, y = _point(at)
+            angle = math.radians(float(at.items[3]))
+            length = float(child.get("length").items[1])
+            end = (x + length * math.cos(angle), y + length * math.sin(angle))
+            out.append(("pin", ((x, y), end), "", False))
+
+
+_lib_graphics = {}  # lib_id -> primitives in library coordinates
+
+def lib_sym_graphics(lib_id):
+    """Drawing primitives of `lib_id` (see _graphics()), parsed once."""
+    prims = _lib_graphics.get(lib_id)
+    if prims is None:
+        prims = []
+        for node in parse(lib_sym_for(lib_id).encode()).lists("symbol"):
+            _graphics(node, prims)
+        _lib_graphics[lib_id] = prims
+    return prims
+
+
+def _orient(rot, mirror):
+    """Library point (mm, y up) -> schematic offset (nm, y down) for an
+    instance at `rot` degrees, as library.lib_sym_pin_offsets() places pins."""
+    c, s = ROTATIONS[rot % 360]
+    flip = -1 if mirror else 1
+
+    def transform(p):
+        px, py = p
+        rx, ry = px * c - py * s, (px * s + py * c) * flip
+        return to_nm(rx), -to_nm(ry)
+    return transform
+
+
+def _arc_path(start, mid, end):
+    """SVG path data of the circular arc from `start` through `mid` to
+    `end` (schematic coordinates)."""
+    (ax, ay), (bx, by), (cx, cy) = start, mid, end
+    d = 2 * (ax * (by - cy) + bx * (cy - ay) + cx * (ay - by))
+    if d == 0:  # collinear: a straight line
+        return f"M{mm(ax)} {mm(ay)}L{mm(cx)} {mm(cy)}"
+    a2, b2, c2 = ax * ax + ay * ay, bx * bx + by * by, cx * cx + cy * cy
+    ox = (a2 * (by - cy) + b2 * (cy - ay) + c2 * (ay - by)) / d
+    oy = (a2 * (cx - bx) + b2 * (ax - cx) + c2 * (bx - ax)) / d
+    r = math.hypot(ax - ox, ay - oy)
+    # Sweep follows the turn start -> mid -> end (clockwise on screen is
+    # SVG's positive direction); the arc is large when mid and the centre
+    # lie on the same side of the start-end chord
+    cross = (bx - ax) * (cy - ay) - (by - ay) * (cx - ax)
+    sweep = 1 if cross > 0 else 0
+    side = (cx - ax) * (oy - ay) - (cy - ay) * (ox - ax)
+    large = 1 if (side > 0) == (cross < 0) else 0
+    return (f"M{mm(ax)} {mm(ay)}A{mm(round(r))} {mm(round(r))} 0 {large} {sweep} "
+            f"{mm(cx)} {mm(cy)}")
+
+
+def _symbol_group(gid, lib_id, rot, mirror):
+    """<g> of `lib_id` drawn at the origin in orientation (rot, mirror)."""
+    t = _orient(rot, mirror)
+    out = [f'    <g id="{gid}">']
+    for prim in lib_sym_graphics(lib_id):
+        kind = prim[0]
+        if kind == "circle":
+            _, center, radius, fill = prim
+            x, y = t(center)
+            cls = f' class="{fill}"' if fill else ""
+            out.append(f'      <circle cx="{mm(x)}" cy="{mm(y)}" r="{mm(to_nm(radius))}"{cls}/>')
+        elif kind == "arc":
+            _, start, mid, end, fill = prim
+            cls = f' class="{fill}"' if fill else ""
+            out.append(f'      <path d="{_arc_path(t(start), t(mid), t(end))}"{cls}/>')
+        else:
+            _, pts, fill, closed = prim
+            points = " ".join(f"{mm(x)},{mm(y)}" for x, y in map(t, pts))
+            tag = "polygon" if closed or fill else "polyline"
+            cls = ' class="pin"' if kind == "pin" else (f' class="{fill}"' if fill else "")
+            out.append(f'      <{tag} points="{points}"{cls}/>')
+    out.append("    </g>")
+    return "\n".join(out)
+
+
+# -- schematic ----------------------------------------------------------------
+
+def _text(x, y, s, cls=None, anchor=None, rot=0, size=None):
+    attrs = f' class="{cls}"' if cls else ""
+    if anchor:
+        attrs += f' text-anchor="{anchor}"'
+    if size:
+        attrs += f' font-size="{size}"'
+    if rot:
+        attrs += f' transform="rotate({-rot} {mm(x)} {mm(y)})"'
+    return f'  <text x="{mm(x)}" y="{mm(y)}"{attrs}>{escape(s)}</text>'
+
+
+def _label(item):
+    """Text of global label `item`, running away from its connection
+    point in the direction of its angle."""
+    rot = item.rot % 360
+    anchor = "start" if rot in (0, 90) else "end"
+    return _text(item.x, item.y, item.name, "lbl", anchor, 90 if rot in (90, 270) else 0)
+
+
+def _extent(sb):
+    """(x0, y0, x1, y1) of the drawing, at least the page."""
+    x0, y0 = 0, 0
+    x1, y1 = PAGE
+    for item in sb.items:
+        if isinstance(item, Wire):
+            xs, ys = (item.x1, item.x2), (item.y1, item.y2)
+        elif isinstance(item, Rect):
+            xs, ys = (item.x, item.x + item.w), (item.y, item.y + item.h)
+        elif isinstance(item, RawItem):
+            continue  # kept from an edited file, not previewed
+        else:
+            xs, ys = (item.x,), (item.y,)
+        x0, x1 = min(x0, *xs), max(x1, *xs)
+        y0, y1 = min(y0, *ys), max(y1, *ys)
+    return x0 - MARGIN, y0 - MARGIN, x1 + MARGIN, y1 + MARGIN
+
+
+def iter_svg(sb, title=None):
+    """Yield the SVG document of SchematicBuilder `sb` in chunks."""
+    x0, y0, x1, y1 = _extent(sb)
+    w, h = x1 - x0, y1 - y0
+    yield (f'<svg xmlns="http://www.w3.org/2000/svg" xmlns:xlink="http://www.w3.org/1999/xlink" '
+           f'width="{mm(w)}mm" height="{mm(h)}mm" viewBox="{mm(x0)} {mm(y0)} {mm(w)} {mm(h)}">\n')
+    if title:
+        yield f"  <title>{escape(title)}</title>\n"
+    yield STYLE
+    yield f'  <rect x="{mm(x0)}" y="{mm(y0)}" width="{mm(w)}" height="{mm(h)}" fill="#f5f4ef"/>\n'
+
+    groups = {}  # (lib_id, rot, mirror) -> group id
+    symbols = [item for item in sb.items if isinstance(item, Symbol)]
+    yield '  <defs class="sym">\n'
+    for item in symbols:
+        key = (item.lib_id, item.rot % 360, bool(item.mirror))
+        if key not in groups:
+            gid = groups[key] = f"s{len(groups)}"
+            yield _symbol_group(gid, *key) + "\n"
+    yield "  </defs>\n"
+
+    lines = []
+    for item in sb.items:
+        if isinstance(item, Wire):
+            lines.append(f'  <line x1="{mm(item.x1)}" y1="{mm(item.y1)}" '
+                         f'x2="{mm(item.x2)}" y2="{mm(item.y2)}" class="w"/>')
+        elif isinstance(item, Junction):
+            lines.append(f'  <circle cx="{mm(item.x)}" cy="{mm(item.y)}" r="{mm(JUNCTION_R)}" class="j"/>')
+        elif isinstance(item, NoConnect):
+            x, y, d = item.x, item.y, NO_CONNECT
+            lines.append(f'  <path d="M{mm(x - d)} {mm(y - d)}L{mm(x + d)} {mm(y + d)}'
+                         f'M{mm(x - d)} {mm(y + d)}L{mm(x + d)} {mm(y - d)}" class="nc"/>')
+        elif isinstance(item, Rect):
+            lines.append(f'  <rect x="{mm(item.x)}" y="{mm(item.y)}" width="{mm(item.w)}" '
+                         f'height="{mm(item.h)}" class="brd"/>')
+        elif isinstance(item, Text):
+            lines.append(_text(item.x, item.y, item.text, "ttl", size=item.size))
+        elif isinstance(item, Label):
+            lines.append(_label(item))
+        elif isinstance(item, Symbol):
+            gid = groups[(item.lib_id, item.rot % 360, bool(item.mirror))]
+            lines.append(f'  <use xlink:href="#{gid}" x="{mm(item.x)}" y="{mm(item.y)}" class="sym"/>')
+            if isinstance(item, Power):
+                lines.append(_text(item.x, item.y + PROPERTY_OFFSET, item.value, anchor="middle"))
+            else:
+                rx = item.x + PROPERTY_OFFSET
+                lines.append(_text(rx, item.y, item.ref))
+                lines.append(_text(rx, item.y - PROPERTY_OFFSET, item.value))
+        if len(lines) >= 4096:
+            yield "\n".join(lines) + "\n"
+            lines.clear()
+    if lines:
+        yield "\n".join(lines) + "\n"
+    yield "</svg>\n"
+
+
+def write_svg(f, sb, title=None):
+    """Write the SVG of `sb` to text file `f`."""
+    for chunk in iter_svg(sb, title):
+        f.write(chunk)
+
+
+def render_svg(sb, title=None):
+    """The SVG of `sb` as a string."""
+    return "".join(iter_svg(sb, title))
+
+
+def main(argv=None):
+    from .cli import HARDWARE_DIR, OUTPUT_NAME, find_boards, load_board
+    parser = argparse.ArgumentParser(
+        prog="python -m schgen.svg",
+        description="Render SVG previews of the generated schematics.")
+    parser.add_argument("boards", nargs="*", help="board directories (default: all)")
+    parser.add_argument("-o", "--output", metavar="DIR",
+                        help="write <board>.svg into DIR (default: next to each board's schematic)")
+    args = parser.parse_args(argv)
+    name = os.path.splitext(OUTPUT_NAME)[0] + ".svg"
+    for board in args.boards or find_boards():
+        sb = load_board(board).build_schematic()
+        if args.output:
+            os.makedirs(args.output, exist_ok=True)
+            path = os.path.join(args.output, f"{board}.svg")
+        else:
+            path = os.path.join(HARDWARE_DIR, board, name)
+        with open(path, "w", encoding="utf-8") as f:
+            write_svg(f, sb, title=board)
+        print(f"Rendered: {os.path.relpath(path)}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
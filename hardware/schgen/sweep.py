@@ -0,0 +1,128 @@
+"""
+Design-space sweep: build and write every combination of a board's
+parameters.
+
+The first variant is built in this process; the rest go to a process pool
+whose workers start with the library symbols that build rendered.  Each
+variant is written next to the board as
+hydroponics-controller-sweep-<variant>.kicad_sch.
+
+Run: python -m schgen.sweep OPNhydro_r2 drivers=6,16,64 test_points=all,none -j 4
+     (from hardware/)
+"""
+
+import argparse
+import ast
+import itertools
+import os
+import time
+
+from .cli import HARDWARE_DIR, OUTPUT_NAME, load_board
+from .fpcache import check_footprints
+from .library import preload_lib_syms, rendered_lib_syms
+from .netlist import extract_netlist
+from .writer import write_if_changed
+
+
+def parse_grid(specs):
+    """{"name": [values]} from "name=v1,v2,..." strings.  Values are Python
+    literals where they parse as one (6, 1.5, None), else strings."""
+    grid = {}
+    for spec in specs:
+        name, sep, values = spec.partition("=")
+        if not sep or not name:
+            raise ValueError(f"expected name=value[,value...], got {spec!r}")
+        grid[name] = [_literal(v) for v in values.split(",")]
+    return grid
+
+def _literal(text):
+    try:
+        return ast.literal_eval(text)
+    except (ValueError, SyntaxError):
+        return text
+
+
+def variants(grid):
+    """Every combination of `grid`, as parameter dicts, first name slowest."""
+    names = list(grid)
+    return [dict(zip(names, values)) for values in itertools.product(*grid.values())]
+
+
+def variant_name(params):
+    """File-name part for `params`, e.g. "drivers-16_test_points-all"."""
+    return "_".join(f"{name}-{value}" for name, value in params.items()) or "default"
+
+
+def variant_path(board_dir, params):
+    stem, ext = os.path.splitext(OUTPUT_NAME)
+    return os.path.join(board_dir, f"{stem}-sweep-{variant_name(params)}{ext}")
+
+
+def _build_variant(board, root, params):
+    """Build and write one variant; return (path, parts, nets, bytes, seconds)."""
+    module = load_board(board, root)
+    t0 = time.perf_counter()
+    sb = module.build_schematic(**params)
+    dt = time.perf_counter() - t0
+    board_dir = os.path.join(root, board)
+    check_footprints(sb, board_dir)
+    path = variant_path(board_dir, params)
+    write_if_changed(path, sb)
+    return path, len(sb.symbols), len(extract_netlist(sb)), os.path.getsize(path), dt
+
+
+def sweep(board, grid, jobs=1, root=HARDWARE_DIR):
+    """Build every variant of `board` in `grid`.  Returns an iterator of
+    (params, path, parts, nets, bytes, build seconds) in grid order; unknown
+    parameter names raise ValueError straight away."""
+    module = load_board(board, root)
+    known = getattr(module, "PARAMS", None)
+    if known is not None:
+        unknown = sorted(set(grid) - set(known))
+        if unknown:
+            raise ValueError(f"{board} has no parameter(s) {', '.join(unknown)}; "
+                             f"known: {', '.join(known)}")
+    return _run(board, root, variants(grid), jobs)
+
+
+def _run(board, root, todo, jobs):
+    if not todo:
+        return
+    yield (todo[0],) + _build_variant(board, root, todo[0])
+    rest = todo[1:]
+    if jobs > 1 and len(rest) > 1:
+        from concurrent.futures import ProcessPoolExecutor
+        with ProcessPoolExecutor(max_workers=min(jobs, len(rest)),
+                                 initializer=preload_lib_syms,
+                                 initargs=(rendered_lib_syms(),)) as pool:
+            rows = pool.map(_build_variant, [board] * len(rest), [root] * len(rest), rest)
+            for params, row in zip(rest, rows):
+                yield (params,) + row
+    else:
+        for params in rest:
+            yield (params,) + _build_variant(board, root, params)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m schgen.sweep",
+        description="Generate every combination of a board's parameters.")
+    parser.add_argument("board", help="board directory, e.g. OPNhydro_r2")
+    parser.add_argument("grid", nargs="*", metavar="NAME=V1,V2",
+                        help="parameter values to sweep")
+    parser.add_argument("-j", "--jobs", type=int, default=os.cpu_count() or 1,
+                        help="build variants in a pool of JOBS processes (default: CPUs)")
+    args = parser.parse_args(argv)
+    try:
+        grid = parse_grid(args.grid)
+        rows = sweep(args.board, grid, jobs=args.jobs)
+        print(f"{'variant':<40} {'parts':>6} {'nets':>6} {'kB':>8} {'build ms':>9}")
+        for params, path, parts, nets, size, dt in rows:
+            print(f"{variant_name(params):<40} {parts:>6} {nets:>6} {size / 1e3:>8.1f} "
+                  f"{dt * 1e3:>9.1f}")
+    except ValueError as e:
+        parser.error(str(e))
+
+
+if __name__ == "__main__":
+    main()
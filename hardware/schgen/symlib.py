@@ -0,0 +1,136 @@
+"""
+Symbols from a KiCad .kicad_sym library, parsed on demand.
+
+A library like Coert-Vonk.kicad_sym holds a few hundred symbols, of which a
+design places a handful.  SymbolLibrary scans the file once into a
+name -> byte range index (pickled next to the file, reused until its mtime
+or size changes) and parses a symbol's range only when that symbol is
+asked for.
+
+The scan relies on KiCad's own formatting: every top-level symbol starts
+on a line of its own, indented by one tab.  Libraries saved by KiCad 9 are
+written out in the KiCad 8 form the schematic's header declares (see
+writer.py).
+"""
+
+import os
+import re
+
+from .cache import cached, file_stamp
+from .parser import SList, dumps, parse, quote
+from .sections import CACHE_DIRNAME
+
+_SYMBOL_RE = re.compile(rb'^\t\(symbol "((?:[^"\\]|\\.)*)"', re.M)
+_INDENT_RE = re.compile(r"^\t+", re.M)
+
+# KiCad 9 writes these flags as (hide yes); KiCad 8 reads only a bare hide
+_BARE_HIDE = frozenset(("pin", "pin_names", "pin_numbers"))
+# KiCad 9 tokens KiCad 8 does not know
+_KICAD9_ONLY = frozenset(("embedded_fonts",))
+
+
+class SymbolLibrary:
+    """Offset index of one .kicad_sym file."""
+    __slots__ = ("path", "offsets")
+
+    def __init__(self, path, offsets):
+        self.path = path
+        self.offsets = offsets  # symbol name -> (start, end) byte range
+
+    def __contains__(self, name):
+        return name in self.offsets
+
+    def __len__(self):
+        return len(self.offsets)
+
+    def names(self):
+        return list(self.offsets)
+
+    def symbol(self, name):
+        """(symbol ...) SList of `name`, read and parsed from its range."""
+        start, end = self.offsets[name]
+        with open(self.path, "rb") as f:
+            f.seek(start)
+            return parse(f.read(end - start)).items[0]
+
+    def flat_symbol(self, name):
+        """symbol(name), with an (extends "parent") resolved the way KiCad
+        embeds derived symbols: the parent's drawing and pins under the
+        derived name, with the derived symbol's properties."""
+        node = self.symbol(name)
+        base = node.get("extends")
+        if base is None:
+            return node
+        parent = self.flat_symbol(base.value())
+        own = {p.value(1): p for p in node.lists("property")}
+        flat = SList(["symbol", quote(name)], ["", " "], parent.tail)
+        for space, item in zip(parent.space[2:], parent.items[2:]):
+            if isinstance(item, SList) and item.head == "property":
+                item = own.pop(item.value(1), item)
+            elif isinstance(item, SList) and item.head == "symbol":
+                # Units are named after their symbol: "<name>_<unit>_<style>"
+                unit = item.value(1)[len(parent.value(1)):]
+                item = SList(["symbol", quote(name + unit)] + item.items[2:],
+                             item.space, item.tail)
+            flat.items.append(item)
+            flat.space.append(space)
+        # Properties only the derived symbol has go after the parent's
+        at = max(i for i, item in enumerate(flat.items)
+                 if isinstance(item, SList) and item.head == "property") + 1
+        for prop in own.values():
+            flat.items.insert(at, prop)
+            flat.space.insert(at, node.space[node.items.index(prop)])
+            at += 1
+        return flat
+
+    def symbol_text(self, name, nickname):
+        """Definition of `name` for a schematic's lib_symbols block, as
+        lib_id "nickname:name", indented like the built-in definitions."""
+        node = self.flat_symbol(name)
+        _to_kicad8(node)
+        node.items[1] = quote(f"{nickname}:{name}")
+        text = "(" + dumps(node) + ")"
+        return "    " + _INDENT_RE.sub(lambda m: "  " * (len(m.group()) + 1), text)
+
+
+def _to_kicad8(node):
+    """Rewrite the KiCad 9 syntax in `node` and its children, in place."""
+    items, space = [], []
+    for sp, item in zip(node.space, node.items):
+        if isinstance(item, SList):
+            head = item.head
+            if head in _KICAD9_ONLY:
+                continue
+            if head == "hide" and node.head in _BARE_HIDE:
+                if item.items[1:] == ["no"]:
+                    continue
+                item = "hide"
+            else:
+                _to_kicad8(item)
+        items.append(item)
+        space.append(sp)
+    node.items, node.space = items, space
+
+
+def scan(path):
+    """{symbol name: (start, end)} of every top-level symbol in `path`."""
+    with open(path, "rb") as f:
+        data = f.read()
+    starts = [(m.start() + 1, m.group(1).decode("utf-8").replace('\\"', '"'))
+              for m in _SYMBOL_RE.finditer(data)]
+    offsets = {}
+    for i, (start, name) in enumerate(starts):
+        limit = starts[i + 1][0] if i + 1 < len(starts) else len(data)
+        end = data.rindex(b"\n\t)", start, limit) + 3
+        offsets[name] = (start, end)
+    return offsets
+
+
+def load_symbol_library(path, index_dir=None):
+    """SymbolLibrary of .kicad_sym `path`.  The index is kept in `index_dir`
+    (default: a cache directory next to `path`) and rebuilt when the file's
+    mtime or size no longer matches."""
+    if index_dir is None:
+        index_dir = os.path.join(os.path.dirname(path), CACHE_DIRNAME)
+    index_path = os.path.join(index_dir, os.path.basename(path) + ".index")
+    return SymbolLibrary(path, cached(index_path, file_stamp(path), lambda: scan(path)))
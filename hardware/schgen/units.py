@@ -0,0 +1,34 @@
+"""
+Coordinates in integer nanometres, KiCad's internal unit.
+
+Board code places parts in millimetres; the builder converts every
+coordinate with to_nm() on the way in, so float noise from arithmetic like
+`pin_top - 7.62` is rounded away and coincident points compare (and hash)
+exactly.  mm() formats a coordinate the way the schematic file writes it.
+"""
+
+NM_PER_MM = 1_000_000
+
+
+def to_nm(mm):
+    """Millimetres -> integer nanometres."""
+    return round(mm * NM_PER_MM)
+
+
+def to_mm(nm):
+    """Integer nanometres -> millimetres (float)."""
+    return nm / NM_PER_MM
+
+
+# Formatted coordinates; a schematic reuses a few thousand distinct values
+_mm_text = {}
+
+def mm(nm):
+    """Text of coordinate `nm` in millimetres with two decimals, rounded
+    half away from zero (e.g. 127000000 -> "127.00")."""
+    text = _mm_text.get(nm)
+    if text is None:
+        q = (abs(nm) + 5_000) // 10_000  # hundredths of a millimetre
+        sign = "-" if nm < 0 and q else ""
+        text = _mm_text[nm] = f"{sign}{q // 100}.{q % 100:02d}"
+    return text
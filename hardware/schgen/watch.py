@@ -0,0 +1,103 @@
+"""
+Watch mode: stay resident and regenerate boards as their
+generate_schematic.py, the module their sections come from or their design
+file is edited.
+
+The board sources are polled for a changed mtime and only changed modules
+are reloaded.  Everything else stays warm in the process: rendered library
+symbols, the fp-info-cache index, symbol library indexes and the section
+cache, so only the sections whose source changed are rebuilt.
+"""
+
+import importlib
+import os
+import sys
+import time
+
+from .cli import HARDWARE_DIR, _cache_dir, _output_path, load_board
+from .design import take_loaded
+from .fpcache import check_footprints
+from .merge import merge_file
+from .writer import write_if_changed
+
+
+def _regenerate(module, board_dir, jobs, merge):
+    """Build and write one board; return (path, written)."""
+    out_path = _output_path(board_dir, "")
+    sb = module.build_schematic(jobs=jobs, cache_dir=_cache_dir(board_dir, "", True))
+    check_footprints(sb, board_dir)
+    layout = out_path if merge is True else merge
+    if layout and os.path.exists(layout):
+        merge_file(sb, layout)
+    return out_path, write_if_changed(out_path, sb)
+
+
+def _sources(module):
+    """Files board `module` is built from: itself and the modules its
+    SECTIONS are defined in (e.g. sections shared between revisions)."""
+    files = {module.__file__}
+    files.update(section.__code__.co_filename for section in getattr(module, "SECTIONS", ()))
+    # A reload may find a module through another sys.path entry ("x/../y")
+    return {os.path.abspath(path) for path in files}
+
+
+def _stamp(files):
+    """{path: mtime} of `files`, or None while one is missing (mid-save)."""
+    try:
+        return {path: os.stat(path).st_mtime_ns for path in files}
+    except OSError:
+        return None
+
+
+def _reload(module, changed):
+    """Reload the modules defining the `changed` files, then board `module`
+    itself, which imports from them."""
+    for other in list(sys.modules.values()):
+        path = getattr(other, "__file__", None)
+        if other is not module and path and os.path.abspath(path) in changed:
+            importlib.reload(other)
+    return importlib.reload(module)
+
+
+def watch(boards, root=HARDWARE_DIR, jobs=1, merge=False, interval=0.25, log=print):
+    """Regenerate each board in `boards` now and whenever its
+    sources (see _sources()) change, polling every `interval` seconds, until
+    interrupted.  `merge` is True or a file to keep the layout of, as in
+    --merge.  Errors in an edited board are reported and the previous
+    output is left in place."""
+    modules = {name: load_board(name, root) for name in boards}
+    stamps = dict.fromkeys(boards)
+    designs = {name: set() for name in boards}  # as read by the last build
+    log(f"Watching {', '.join(boards)} (Ctrl-C to stop)")
+    try:
+        while True:
+            for name, module in modules.items():
+                stamp = _stamp(_sources(module) | designs[name])
+                if stamp is None or stamp == stamps[name]:
+                    continue
+                t0 = time.perf_counter()
+                take_loaded()
+                try:
+                    if stamps[name] is not None:
+                        changed = {path for path, mtime in stamp.items()
+                                   if stamps[name].get(path) != mtime}
+                        module = modules[name] = _reload(module, changed)
+                    path, written = _regenerate(module, os.path.join(root, name), jobs, merge)
+                except Exception as e:  # a half-edited board must not end the watch
+                    log(f"error: {name}: {type(e).__name__}: {e}")
+                else:
+                    status = "Generated" if written else "Unchanged"
+                    log(f"{status}: {os.path.relpath(path)} "
+                        f"({(time.perf_counter() - t0) * 1e3:.1f} ms)")
+                # Also watch the design files the build read, even one it
+                # failed on; a build that failed before reading any keeps
+                # the previous ones
+                loaded = take_loaded()
+                new = _stamp(loaded - stamp.keys())
+                if loaded and new is not None:
+                    designs[name] = loaded
+                    stamp.update(new)
+                stamps[name] = stamp
+            time.sleep(interval)
+    except KeyboardInterrupt:
+        pass
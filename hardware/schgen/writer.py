@@ -0,0 +1,129 @@
+"""Assemble and write the full .kicad_sch file."""
+
+import os
+import stat
+
+from .builder import stable_uuid
+from .items import Symbol
+from .library import lib_sym_for
+
+
+def iter_schematic(sb):
+    """Yield the .kicad_sch file as a sequence of newline-terminated chunks.
+
+    Nothing is joined here, so the caller decides whether to buffer or to
+    stream the chunks straight to a file handle (see write_schematic()).
+    """
+    root_uuid = stable_uuid("sheet:/", sb.namespace)
+
+    yield '(kicad_sch\n'
+    yield '  (version 20231120)\n'
+    yield '  (generator "eeschema")\n'
+    yield '  (generator_version "8.0")\n'
+    yield f'  (uuid "{root_uuid}")\n'
+    yield '  (paper "A3")\n'
+    yield '\n'
+    yield '  (lib_symbols\n'
+    for ls in iter_lib_symbols(sb):
+        yield ls + '\n'
+    yield '  )\n'
+    yield '\n'
+
+    # All schematic items
+    for item in sb.items:
+        yield item.render() + '\n'
+
+    yield '\n'
+    yield '  (sheet_instances\n'
+    yield '    (path "/"\n'
+    yield '      (page "1")\n'
+    yield '    )\n'
+    yield '  )\n'
+    yield ')\n'
+
+
+def iter_lib_symbols(sb):
+    """Yield the definitions of the library symbols placed in `sb`.
+
+    Sorted by lib_id, as KiCad does, so the block is stable when sections
+    are reordered.
+    """
+    used = {item.lib_id for item in sb.items if isinstance(item, Symbol)}
+    for lib_id in sorted(used):
+        yield lib_sym_for(lib_id)
+
+
+def write_schematic(f, sb):
+    """Stream the schematic to the open text file `f`; return chars written.
+
+    Peak memory stays at roughly one item, independent of schematic size.
+    """
+    n = 0
+    for chunk in iter_schematic(sb):
+        f.write(chunk)
+        n += len(chunk)
+    return n
+
+
+def write_if_changed(path, sb):
+    """Write the schematic to `path` unless the file already holds exactly
+    this content; return True if the file was (re)written.
+
+    The schematic is rendered once and compared with the existing file as
+    it streams.  From the first difference on it goes to a temporary file
+    next to `path` that then replaces it in one rename, so KiCad never sees
+    a half-written file and an unchanged file keeps its mtime.  A rewritten
+    file keeps its permissions.
+    """
+    try:
+        old = open(path, "rb")
+    except FileNotFoundError:
+        old = None
+    else:
+        mode = stat.S_IMODE(os.fstat(old.fileno()).st_mode)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    out = None
+    same = 0  # leading bytes equal to the existing file
+    try:
+        for chunk in iter_schematic(sb):
+            data = chunk.encode("utf-8")
+            if out is None:
+                if old is not None and old.read(len(data)) == data:
+                    same += len(data)
+                    continue
+                out = open(tmp_path, "wb")
+                if same:
+                    _copy_head(old, out, same)
+            out.write(data)
+        if out is None:
+            if old is not None and not old.read(1):
+                return False
+            out = open(tmp_path, "wb")  # the file has more after our content
+            _copy_head(old, out, same)
+        out.close()
+    except BaseException:
+        if out is not None:
+            out.close()
+            os.remove(tmp_path)
+        raise
+    finally:
+        if old is not None:
+            old.close()
+    if old is not None:
+        os.chmod(tmp_path, mode)
+    os.replace(tmp_path, path)
+    return True
+
+
+def _copy_head(src, dst, n):
+    """Copy the first `n` bytes of open file `src` to `dst`."""
+    src.seek(0)
+    while n:
+        block = src.read(min(n, 1 << 16))
+        dst.write(block)
+        n -= len(block)
+
+
+def generate(sb):
+    """Return the complete schematic as a single string."""
+    return "".join(iter_schematic(sb))